@@ -1,19 +1,26 @@
-from langchain_core.prompts import PromptTemplate, ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.runnables import RunnableSequence
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
-from app.calendar_service import EnhancedCalendarService
+from app.calendar_service import EnhancedCalendarService, format_clock_time, format_meeting_time
 from app.config import Config
+from app.llm_cache import LLMCache, SemanticCache
 from app.logging_config import logger
 from datetime import datetime, timedelta, time
+import asyncio
 import dateutil.parser
+import numpy as np
 import re
 import json
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Tuple
+from collections import deque
+from itertools import islice
 from enum import Enum
-import pytz
+from zoneinfo import ZoneInfo
 from dataclasses import dataclass
 
+# langchain and httpx are imported where the LLM clients are first built,
+# so importing this module (and the app's health checks) stays fast
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 class Intent(Enum):
     BOOK_MEETING = "book_meeting"
     CHECK_AVAILABILITY = "check_availability"
@@ -23,21 +30,116 @@ class Intent(Enum):
     GREETING = "greeting"
     UNCLEAR = "unclear"
 
+# Keywords for the local intent router; anything ambiguous falls through to the LLM
+FAST_INTENT_KEYWORDS = {
+    Intent.BOOK_MEETING: ("book", "schedule", "set up", "arrange"),
+    Intent.CANCEL_MEETING: ("cancel", "delete", "remove"),
+    Intent.LIST_MEETINGS: ("list", "show", "upcoming", "my meetings"),
+    Intent.CHECK_AVAILABILITY: ("available", "free", "availability", "open slot"),
+    Intent.RESCHEDULE_MEETING: ("reschedule", "move", "change time"),
+    Intent.GREETING: ("hi", "hello", "hey", "good morning")
+}
+
+_FAST_INTENT_PATTERNS = {
+    intent: re.compile(r"\b(?:" + "|".join(re.escape(keyword) for keyword in keywords) + r")\b")
+    for intent, keywords in FAST_INTENT_KEYWORDS.items()
+}
+
+# Intent label in a model reply, tolerating quotes, markdown and a leading "intent:"
+_INTENT_LABEL_RE = re.compile(r'^\W*(?:intent\s*[:=-]\s*)?\W*([a-z_]+)')
+
+def parse_intent_label(text: str) -> Optional[Intent]:
+    """Map a classifier reply to an Intent, or None when it names no known intent"""
+    match = _INTENT_LABEL_RE.match(text.strip().lower())
+    if match:
+        try:
+            return Intent(match.group(1))
+        except ValueError:
+            pass
+    return None
+
+_WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6,
+    'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6
+}
+
+# (pattern, minutes per unit); None marks the combined hour + minute format
+_DURATION_PATTERNS = (
+    (re.compile(r'(\d+)\s*(?:hour|hr)s?'), 60),
+    (re.compile(r'(\d+)\s*(?:minute|min)s?'), 1),
+    (re.compile(r'(\d+)\s*h\s*(\d+)\s*m'), None)
+)
+
+_MONTH_NAME = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+
+# Absolute dates ("2025-01-10", "dec 5", "5th december 2026") with an optional trailing time
+_ABSOLUTE_DATE_RE = re.compile(
+    r'(?:\d{4}-\d{2}-\d{2}'
+    r'|' + _MONTH_NAME + r'\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s+\d{4})?'
+    r'|\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?' + _MONTH_NAME + r'(?:,?\s+\d{4})?)'
+    r'(?:\s*(?:at|,)?\s*\d{1,2}(?::\d{2})?\s*(?:am|pm)?\b)?'
+)
+_YEAR_RE = re.compile(r'\b\d{4}\b')
+
+# Relative time patterns tried in order; handlers receive (agent, match, now)
+_RELATIVE_TIME_PATTERNS = (
+    (re.compile(r'in (\d+) (?:hour|hr)s?'), lambda agent, m, now: now + timedelta(hours=int(m.group(1)))),
+    (re.compile(r'in (\d+) (?:minute|min)s?'), lambda agent, m, now: now + timedelta(minutes=int(m.group(1)))),
+    (re.compile(r'tomorrow at (\d{1,2}):?(\d{2})?\s*(am|pm)?'), lambda agent, m, now: agent._parse_tomorrow_time(m)),
+    (re.compile(r'next (\w+)'), lambda agent, m, now: agent._parse_next_weekday(m)),
+    (re.compile(r'(\w+) at (\d{1,2}):?(\d{2})?\s*(am|pm)?'), lambda agent, m, now: agent._parse_weekday_time(m)),
+    (re.compile(r'at (\d{1,2}):?(\d{2})?\s*(am|pm)?'), lambda agent, m, now: agent._parse_today_time(m)),
+    (re.compile(r'(\d{1,2}):?(\d{2})?\s*(am|pm)'), lambda agent, m, now: agent._parse_today_time(m)),
+    (re.compile(r'end of (?:the )?week'), lambda agent, m, now: agent._get_end_of_week()),
+    (re.compile(r'beginning of (?:the )?week'), lambda agent, m, now: agent._get_beginning_of_week()),
+    (re.compile(r'next week same time'), lambda agent, m, now: now + timedelta(weeks=1))
+)
+
+# Meeting references for cancel/reschedule, tried in priority order; the first that matches wins
+_MEETING_REFERENCE_PATTERNS = (
+    ("time", re.compile(r'(\d{1,2}:\d{2})\s*(am|pm)?', re.IGNORECASE)),
+    ("day", re.compile(r'(tomorrow|today|monday|tuesday|wednesday|thursday|friday|saturday|sunday)', re.IGNORECASE)),
+    ("attendee", re.compile(r'meeting with (\w+)', re.IGNORECASE)),
+    ("title", re.compile(r'(\w+) meeting', re.IGNORECASE))
+)
+
 @dataclass
 class ConversationContext:
     """Maintains conversation state and context"""
     user_id: str = "default_user"
     last_intent: Optional[Intent] = None
     pending_booking: Optional[Dict] = None
-    conversation_history: List[Dict] = None
+    conversation_history: Deque[Dict] = None
     user_timezone: str = "Asia/Kolkata"
     preferred_meeting_duration: int = 60
     business_hours_start: time = time(9, 0)
     business_hours_end: time = time(17, 0)
     
+    MAX_HISTORY = 10
+    
     def __post_init__(self):
-        if self.conversation_history is None:
-            self.conversation_history = []
+        # Bounded ring buffer: old turns are evicted on append
+        self.conversation_history = deque(self.conversation_history or (), maxlen=self.MAX_HISTORY)
+        self._tz = ZoneInfo(self.user_timezone)
+        self._business_hours = None
+        self._business_minutes = None
+    
+    @property
+    def business_minutes(self) -> Tuple[int, int]:
+        """Business hours as minutes since midnight, recomputed only when the hours change"""
+        hours = (self.business_hours_start, self.business_hours_end)
+        if self._business_hours != hours:
+            self._business_hours = hours
+            self._business_minutes = tuple(t.hour * 60 + t.minute for t in hours)
+        return self._business_minutes
+    
+    @property
+    def tz(self):
+        """Timezone for user_timezone, looked up again only when the name changes"""
+        if self._tz.key != self.user_timezone:
+            self._tz = ZoneInfo(self.user_timezone)
+        return self._tz
 
 @dataclass
 class ParsedBookingRequest:
@@ -60,25 +162,132 @@ class ParsedBookingRequest:
 class AdvancedBookingAgent:
     """Industry-grade AI booking agent with advanced NLP and scheduling capabilities"""
     
+    # LLM cascade: a small model for classification and phrasing, the reasoning model for extraction
+    LLM_MODEL_SMALL = "deepseek/deepseek-chat"
+    LLM_TEMPERATURE_SMALL = 0.0
+    LLM_MODEL_REASONING = "deepseek/deepseek-r1:free"
+    LLM_TEMPERATURE_REASONING = 0.3
+    
+    # Intent labels are a single word; cap generation and stop streaming once one is read.
+    # The caps leave room for the longest label wrapped as 'Intent: "reschedule_meeting"'
+    INTENT_MAX_TOKENS = 16
+    INTENT_STREAM_CHARS = 48
+    
+    # Cache lifetimes (seconds) per chain
+    CACHE_TTLS = {
+        "intent": 3600,
+        "extraction": 300
+    }
+    
     def __init__(self):
         try:
             Config.validate()
-            self.llm = ChatOpenAI(
-                api_key=Config.LLM_API_KEY,
-                base_url="https://openrouter.ai/api/v1",
-                model="deepseek/deepseek-r1:free",
-                temperature=0.3
-            )
-            self.calendar_service = EnhancedCalendarService()
+            # LLM clients and the calendar service are built on first use so cold
+            # starts and greeting-only turns don't pay for them
+            self.http_client = None
+            self._llm_small = None
+            self._llm_reasoning = None
+            self._calendar_service = None
+            self._init_lock = threading.Lock()
+            self._calendar_lock = threading.Lock()
             self.context = ConversationContext()
-            self._setup_llm_chains()
+            self.llm_cache = LLMCache(Config.LLM_CACHE_PATH)
+            self.semantic_cache = SemanticCache()
             logger.info("Advanced booking agent initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize booking agent: {e}")
             raise
 
-    def _setup_llm_chains(self):
-        """Setup LangChain chains for different tasks"""
+    def _ensure_llm(self):
+        """Create the LLM clients and chains if they don't exist yet"""
+        # Unlocked fast path: once set, _llm_small never changes back
+        if self._llm_small is not None:
+            return
+        
+        with self._init_lock:
+            if self._llm_small is not None:
+                return
+            
+            import httpx
+            from langchain_openai import ChatOpenAI
+            
+            # One HTTP/2 connection pool shared by every LLM client
+            self.http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=300),
+                timeout=httpx.Timeout(30.0)
+            )
+            self._llm_reasoning = ChatOpenAI(
+                api_key=Config.LLM_API_KEY,
+                base_url="https://openrouter.ai/api/v1",
+                model=self.LLM_MODEL_REASONING,
+                temperature=self.LLM_TEMPERATURE_REASONING,
+                http_async_client=self.http_client
+            )
+            llm_small = ChatOpenAI(
+                api_key=Config.LLM_API_KEY,
+                base_url="https://openrouter.ai/api/v1",
+                model=self.LLM_MODEL_SMALL,
+                temperature=self.LLM_TEMPERATURE_SMALL,
+                http_async_client=self.http_client
+            )
+            self._setup_llm_chains(llm_small, self._llm_reasoning)
+            # Assigned last: a non-None _llm_small marks initialization as complete
+            self._llm_small = llm_small
+            logger.info("LLM clients initialized")
+
+    @property
+    def llm_small(self) -> "ChatOpenAI":
+        self._ensure_llm()
+        return self._llm_small
+
+    @property
+    def llm_reasoning(self) -> "ChatOpenAI":
+        self._ensure_llm()
+        return self._llm_reasoning
+
+    @property
+    def intent_chain(self):
+        self._ensure_llm()
+        return self._intent_chain
+
+    @property
+    def intent_chain_reasoning(self):
+        self._ensure_llm()
+        return self._intent_chain_reasoning
+
+    @property
+    def extraction_chain(self):
+        self._ensure_llm()
+        return self._extraction_chain
+
+    @property
+    def calendar_service(self) -> EnhancedCalendarService:
+        if self._calendar_service is None:
+            # Separate lock so loading credentials never waits on LLM client setup (or vice versa)
+            with self._calendar_lock:
+                if self._calendar_service is None:
+                    self._calendar_service = EnhancedCalendarService()
+        return self._calendar_service
+
+    def warm_up(self):
+        """Build the LLM clients and calendar service now instead of on the first request"""
+        self._ensure_llm()
+        _ = self.calendar_service
+
+    async def aclose(self):
+        """Close the shared LLM connection pool"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+    def _setup_llm_chains(self, llm_small: "ChatOpenAI", llm_reasoning: "ChatOpenAI"):
+        """Setup LangChain chains for different tasks
+        
+        System messages are constant so providers can cache the prompt prefix;
+        all per-request values go in the templated human message.
+        """
+        from langchain_core.messages import SystemMessage
+        from langchain_core.prompts import ChatPromptTemplate
         
         # Intent recognition chain
         intent_prompt = ChatPromptTemplate.from_messages([
@@ -95,99 +304,136 @@ Possible intents:
 - unclear: Intent is not clear
 
 Respond with just the intent name (e.g., "book_meeting")."""),
-            HumanMessage(content="User message: {{user_input}}\nPrevious context: {{context}}")
+            ("human", "User message: {user_input}\nPrevious context: {context}")
         ])
-        self.intent_chain = intent_prompt | self.llm
+        self._intent_chain = intent_prompt | llm_small.bind(max_tokens=self.INTENT_MAX_TOKENS)
+        # Escalation path when the small model cannot classify the message
+        self._intent_chain_reasoning = intent_prompt | llm_reasoning
         
         extraction_prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="""Extract booking details from the user's message. Be intelligent about parsing times, dates, and contexts.
-
-User message: "{user_input}"
-Current date/time: {current_datetime}
-User timezone: {timezone}
-Previous context: {context}
-
-Extract and return a JSON object with these fields:
-{
-    "summary": "meeting title/type",
-    "start_time": "ISO datetime or null",
-    "duration_minutes": number,
-    "attendees": ["email1", "email2"],
-    "description": "additional details",
-    "meeting_type": "meeting/call/appointment/interview",
-    "urgency": "low/normal/high/urgent",
-    "flexibility": "rigid/flexible/very_flexible"
-}
-
-Time parsing rules:
-- "tomorrow" = next day
-- "next week" = same day next week
-- "monday" = next occurrence of Monday
-- "in 2 hours" = 2 hours from now
-- "end of week" = Friday
-- Handle AM/PM, 24-hour format, relative times
-
-If time is ambiguous, set start_time to null.
-Default duration is 60 minutes unless specified."""),
-            HumanMessage(content="User message: {user_input}\nCurrent date/time: {current_datetime}\nUser timezone: {timezone}\nPrevious context: {context}")
-        ])
-        self.extraction_chain = extraction_prompt | self.llm
-        
-        response_prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="""You are a friendly, professional AI scheduling assistant. Generate a natural, helpful response.
-
-Situation: {situation}
-User message: {user_input}
-Agent action: {agent_action}
-Result: {result}
-Context: {context}
-
-Generate a conversational response that:
-1. Acknowledges the user's request
-2. Explains what happened
-3. Provides next steps if needed
-4. Asks for clarification if required
-5. Maintains a helpful, professional tone
-
-Keep responses concise but informative."""),
-            HumanMessage(content="Situation: {situation}\nUser message: {user_input}\nAgent action: {agent_action}\nResult: {result}\nContext: {context}")
+            SystemMessage(content="""Extract a booking request as JSON matching this schema:
+{"summary": str, "start_time": ISO8601 | null, "duration_minutes": int, "attendees": [str], "description": str, "meeting_type": "meeting|call|appointment|interview", "urgency": "low|normal|high|urgent", "flexibility": "rigid|flexible|very_flexible"}
+Resolve relative times against the current date/time in the user's timezone. Use null for unknown or ambiguous fields. Default duration_minutes is 60."""),
+            ("human", "User message: {user_input}\nCurrent date/time: {current_datetime}\nUser timezone: {timezone}\nPrevious context: {context}")
         ])
-        self.response_chain = response_prompt | self.llm
+        # JSON mode applies to extraction only; the other chains return plain text
+        self._extraction_chain = extraction_prompt | llm_reasoning.bind(response_format={"type": "json_object"})
+
+    async def _cached_invoke(self, name: str, chain, llm: "ChatOpenAI", payload: Dict, first_line: bool = False,
+                             cacheable: Optional[Callable[[str], bool]] = None) -> str:
+        """Invoke a chain, serving repeated inputs from the LLM cache
+        
+        With first_line set, the output is streamed and generation stops at the
+        first line break, which is all a single-label classifier needs. Output
+        rejected by cacheable is returned but not stored.
+        """
+        key = LLMCache.make_key(name, llm.model_name, llm.temperature, payload)
+        
+        cached = self.llm_cache.get(key, self.CACHE_TTLS[name])
+        if cached is not None:
+            logger.info(f"LLM cache hit for {name} chain")
+            return cached
+        
+        if first_line:
+            content = await self._stream_first_line(chain, payload)
+        else:
+            content = (await chain.ainvoke(payload)).content
+        if cacheable is None or cacheable(content):
+            self.llm_cache.set(key, content)
+        return content
+
+    async def _stream_first_line(self, chain, payload: Dict) -> str:
+        """Stream a chain's output and stop once the first line is complete"""
+        buffer = ""
+        stream = chain.astream(payload)
+        try:
+            async for chunk in stream:
+                buffer += chunk.content
+                if "\n" in buffer.lstrip() or len(buffer) > self.INTENT_STREAM_CHARS:
+                    break
+        finally:
+            # Closing the stream drops the connection and cancels the remaining generation
+            await stream.aclose()
+        
+        return buffer.strip().split("\n", 1)[0]
+
+    def _recent_messages(self, count: int = 3) -> List[Dict]:
+        """Recent conversation turns without timestamps, so identical conversations share a cache key"""
+        history = self.context.conversation_history
+        return [
+            {k: v for k, v in message.items() if k != "timestamp"}
+            for message in islice(history, max(len(history) - count, 0), None)
+        ]
+
+    def _fast_intent(self, user_input: str) -> Optional[Intent]:
+        """Resolve unambiguous intents locally by keyword scoring, without an LLM call"""
+        text = user_input.lower()
+        scores = sorted(
+            ((len(pattern.findall(text)), intent) for intent, pattern in _FAST_INTENT_PATTERNS.items()),
+            key=lambda item: item[0],
+            reverse=True
+        )
+        
+        best_score, best_intent = scores[0]
+        runner_up_score = scores[1][0]
+        
+        if best_score >= 1 and best_score - runner_up_score >= 1:
+            return best_intent
+        return None
 
-    def _recognize_intent(self, user_input: str) -> Intent:
-        """Recognize user intent using LLM"""
+    async def _recognize_intent(self, user_input: str) -> Intent:
+        """Recognize user intent, using the LLM only when keyword routing is ambiguous"""
         try:
+            fast_intent = self._fast_intent(user_input)
+            if fast_intent is not None:
+                return fast_intent
+            
             context_str = json.dumps({
                 "last_intent": self.context.last_intent.value if self.context.last_intent else None,
                 "has_pending_booking": self.context.pending_booking is not None,
-                "recent_messages": self.context.conversation_history[-3:] if self.context.conversation_history else []
+                "recent_messages": self._recent_messages()
             })
             
-            intent_result = self.intent_chain.invoke({
-                "user_input": user_input,
-                "context": context_str
-            }).content.strip().lower()
-            
-            intent_mapping = {
-                "book_meeting": Intent.BOOK_MEETING,
-                "check_availability": Intent.CHECK_AVAILABILITY,
-                "reschedule_meeting": Intent.RESCHEDULE_MEETING,
-                "cancel_meeting": Intent.CANCEL_MEETING,
-                "list_meetings": Intent.LIST_MEETINGS,
-                "greeting": Intent.GREETING,
-                "unclear": Intent.UNCLEAR
-            }
-            
-            return intent_mapping.get(intent_result, Intent.UNCLEAR)
+            # Paraphrases of earlier messages reuse their intent; scoped by conversation state
+            semantic_scope = f"{self.context.last_intent.value if self.context.last_intent else None}:{self.context.pending_booking is not None}"
+            # blocking: embedding model inference (and the first-use model load)
+            cached_intent = await asyncio.to_thread(self.semantic_cache.get, user_input, semantic_scope)
+            if cached_intent is not None:
+                logger.info("Semantic cache hit for intent")
+                return Intent(cached_intent)
+            
+            # Replies that name no intent are not cached, so a malformed label is retried next time
+            def is_label(content: str) -> bool:
+                return parse_intent_label(content) is not None
+            
+            payload = {"user_input": user_input, "context": context_str}
+            intent = parse_intent_label(await self._cached_invoke(
+                "intent", self.intent_chain, self.llm_small, payload, first_line=True, cacheable=is_label
+            ))
+            
+            if intent in (None, Intent.UNCLEAR):
+                logger.info("Small model returned no clear intent, escalating to reasoning model")
+                intent = parse_intent_label(await self._cached_invoke(
+                    "intent", self.intent_chain_reasoning, self.llm_reasoning, payload, first_line=True, cacheable=is_label
+                ))
+            
+            if intent is None:
+                return Intent.UNCLEAR
+            
+            if intent != Intent.UNCLEAR:
+                # blocking: embedding model inference
+                await asyncio.to_thread(self.semantic_cache.set, user_input, intent.value, semantic_scope)
+            return intent
             
         except Exception as e:
             logger.error(f"Error recognizing intent: {e}")
             return Intent.UNCLEAR
 
-    def _extract_booking_details(self, user_input: str) -> ParsedBookingRequest:
+    async def _extract_booking_details(self, user_input: str) -> ParsedBookingRequest:
         """Extract detailed booking information using advanced NLP"""
         try:
-            current_datetime = datetime.now(pytz.timezone(self.context.user_timezone))
+            # Minute precision keeps the extraction payload cacheable within a minute
+            current_datetime = datetime.now(self.context.tz).replace(second=0, microsecond=0)
             context_str = json.dumps({
                 "last_booking": self.context.pending_booking,
                 "preferences": {
@@ -196,12 +442,12 @@ Keep responses concise but informative."""),
                 }
             })
             
-            extraction_result = self.extraction_chain.invoke({
+            extraction_result = await self._cached_invoke("extraction", self.extraction_chain, self.llm_reasoning, {
                 "user_input": user_input,
                 "current_datetime": current_datetime.isoformat(),
                 "timezone": self.context.user_timezone,
                 "context": context_str
-            }).content
+            })
             
             # Parse JSON response
             try:
@@ -215,20 +461,20 @@ Keep responses concise but informative."""),
                 try:
                     start_time = dateutil.parser.parse(details["start_time"])
                     if start_time.tzinfo is None:
-                        start_time = pytz.timezone(self.context.user_timezone).localize(start_time)
+                        start_time = start_time.replace(tzinfo=self.context.tz)
                 except:
                     start_time = None
             
             return ParsedBookingRequest(
                 intent=Intent.BOOK_MEETING,
-                summary=details.get("summary", "Meeting"),
+                summary=details.get("summary") or "Meeting",
                 start_time=start_time,
-                duration=details.get("duration_minutes", self.context.preferred_meeting_duration),
-                attendees=details.get("attendees", []),
-                description=details.get("description", ""),
-                meeting_type=details.get("meeting_type", "meeting"),
-                urgency=details.get("urgency", "normal"),
-                flexibility=details.get("flexibility", "rigid")
+                duration=details.get("duration_minutes") or self.context.preferred_meeting_duration,
+                attendees=details.get("attendees") or [],
+                description=details.get("description") or "",
+                meeting_type=details.get("meeting_type") or "meeting",
+                urgency=details.get("urgency") or "normal",
+                flexibility=details.get("flexibility") or "rigid"
             )
             
         except Exception as e:
@@ -250,21 +496,11 @@ Keep responses concise but informative."""),
             summary = "Standup"
         
         duration = self.context.preferred_meeting_duration
-        duration_patterns = [
-            r'(\d+)\s*(?:hour|hr)s?',
-            r'(\d+)\s*(?:minute|min)s?',
-            r'(\d+)\s*h\s*(\d+)\s*m'
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, user_input_lower)
+        for pattern, unit_minutes in _DURATION_PATTERNS:
+            match = pattern.search(user_input_lower)
             if match:
-                if len(match.groups()) == 1:
-                    num = int(match.group(1))
-                    if 'hour' in pattern or 'hr' in pattern:
-                        duration = num * 60
-                    else:
-                        duration = num
+                if unit_minutes is not None:
+                    duration = int(match.group(1)) * unit_minutes
                 else:  # hour + minute format
                     hours = int(match.group(1))
                     minutes = int(match.group(2))
@@ -283,32 +519,47 @@ Keep responses concise but informative."""),
 
     def _parse_time_advanced(self, user_input: str) -> Optional[datetime]:
         """Advanced time parsing with support for relative dates and fuzzy matching"""
-        now = datetime.now(pytz.timezone(self.context.user_timezone))
-        
-        # Relative time patterns
-        relative_patterns = [
-            (r'in (\d+) (?:hour|hr)s?', lambda m: now + timedelta(hours=int(m.group(1)))),
-            (r'in (\d+) (?:minute|min)s?', lambda m: now + timedelta(minutes=int(m.group(1)))),
-            (r'tomorrow at (\d{1,2}):?(\d{2})?\s*(am|pm)?', self._parse_tomorrow_time),
-            (r'next (\w+)', self._parse_next_weekday),
-            (r'(\w+) at (\d{1,2}):?(\d{2})?\s*(am|pm)?', self._parse_weekday_time),
-            (r'at (\d{1,2}):?(\d{2})?\s*(am|pm)?', self._parse_today_time),
-            (r'(\d{1,2}):?(\d{2})?\s*(am|pm)', self._parse_today_time),
-            (r'end of (?:the )?week', lambda m: self._get_end_of_week()),
-            (r'beginning of (?:the )?week', lambda m: self._get_beginning_of_week()),
-            (r'next week same time', lambda m: now + timedelta(weeks=1))
-        ]
+        now = datetime.now(self.context.tz)
+        user_input = user_input.lower()
         
-        for pattern, parser in relative_patterns:
-            match = re.search(pattern, user_input.lower())
+        absolute_time = self._parse_absolute_date(user_input, now)
+        if absolute_time:
+            return absolute_time
+        
+        for pattern, parser in _RELATIVE_TIME_PATTERNS:
+            match = pattern.search(user_input)
             if match:
                 try:
-                    return parser(match)
+                    return parser(self, match, now)
                 except:
                     continue
         
         return None
 
+    def _parse_absolute_date(self, user_input: str, now: datetime) -> Optional[datetime]:
+        """Parse explicit calendar dates with dateutil, defaulting to business start when no time is given"""
+        match = _ABSOLUTE_DATE_RE.search(user_input)
+        if not match:
+            return None
+        
+        date_text = match.group(0).replace(" of ", " ").replace(" at ", " ")
+        default = now.replace(
+            hour=self.context.business_hours_start.hour,
+            minute=self.context.business_hours_start.minute,
+            second=0, microsecond=0, tzinfo=None
+        )
+        
+        try:
+            parsed = dateutil.parser.parse(date_text, default=default)
+        except (ValueError, OverflowError):
+            return None
+        
+        # A date without a year that has already passed refers to next year
+        if parsed.date() < now.date() and not _YEAR_RE.search(date_text):
+            parsed = parsed.replace(year=parsed.year + 1)
+        
+        return parsed.replace(tzinfo=self.context.tz)
+
     def _parse_tomorrow_time(self, match) -> datetime:
         """Parse 'tomorrow at X' patterns"""
         hour = int(match.group(1))
@@ -321,7 +572,7 @@ Keep responses concise but informative."""),
             elif ampm.lower() == 'am' and hour == 12:
                 hour = 0
         
-        tomorrow = datetime.now(pytz.timezone(self.context.user_timezone)) + timedelta(days=1)
+        tomorrow = datetime.now(self.context.tz) + timedelta(days=1)
         return tomorrow.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
     def _parse_today_time(self, match) -> datetime:
@@ -336,7 +587,7 @@ Keep responses concise but informative."""),
             elif ampm.lower() == 'am' and hour == 12:
                 hour = 0
         
-        today = datetime.now(pytz.timezone(self.context.user_timezone))
+        today = datetime.now(self.context.tz)
         target_time = today.replace(hour=hour, minute=minute, second=0, microsecond=0)
         
         if target_time <= today:
@@ -344,30 +595,27 @@ Keep responses concise but informative."""),
         
         return target_time
 
+    def _next_occurrence_of(self, weekday: int, hour: int, minute: int, allow_today: bool = False) -> datetime:
+        """Next `weekday` at hour:minute; today only counts if allowed and the time is still ahead"""
+        now = datetime.now(self.context.tz)
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        days_ahead = (weekday - now.weekday()) % 7
+        
+        if days_ahead == 0 and not (allow_today and target > now):
+            days_ahead = 7
+        
+        return target + timedelta(days=days_ahead)
+
     def _parse_next_weekday(self, match) -> datetime:
         """Parse 'next Monday' patterns"""
         weekday_name = match.group(1).lower()
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6,
-            'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6
-        }
-        
-        if weekday_name not in weekdays:
+        if weekday_name not in _WEEKDAYS:
             return None
         
-        target_weekday = weekdays[weekday_name]
-        now = datetime.now(pytz.timezone(self.context.user_timezone))
-        days_ahead = target_weekday - now.weekday()
-        
-        if days_ahead <= 0:  
-            days_ahead += 7
-        
-        target_date = now + timedelta(days=days_ahead)
-        return target_date.replace(
-            hour=self.context.business_hours_start.hour,
-            minute=self.context.business_hours_start.minute,
-            second=0, microsecond=0
+        return self._next_occurrence_of(
+            _WEEKDAYS[weekday_name],
+            self.context.business_hours_start.hour,
+            self.context.business_hours_start.minute
         )
 
     def _parse_weekday_time(self, match) -> datetime:
@@ -383,32 +631,14 @@ Keep responses concise but informative."""),
             elif ampm.lower() == 'am' and hour == 12:
                 hour = 0
         
-        weekdays = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6,
-            'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6
-        }
-        
-        if weekday_name not in weekdays:
+        if weekday_name not in _WEEKDAYS:
             return None
         
-        target_weekday = weekdays[weekday_name]
-        now = datetime.now(pytz.timezone(self.context.user_timezone))
-        days_ahead = target_weekday - now.weekday()
-        
-        if days_ahead < 0:  # Target day already happened this week
-            days_ahead += 7
-        elif days_ahead == 0:  # Today - check if time has passed
-            target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if target_time <= now:
-                days_ahead = 7
-        
-        target_date = now + timedelta(days=days_ahead)
-        return target_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return self._next_occurrence_of(_WEEKDAYS[weekday_name], hour, minute, allow_today=True)
 
     def _get_end_of_week(self) -> datetime:
         """Get end of current week (Friday 5 PM)"""
-        now = datetime.now(pytz.timezone(self.context.user_timezone))
+        now = datetime.now(self.context.tz)
         days_until_friday = 4 - now.weekday()  # Friday is weekday 4
         if days_until_friday < 0:
             days_until_friday += 7
@@ -422,7 +652,7 @@ Keep responses concise but informative."""),
 
     def _get_beginning_of_week(self) -> datetime:
         """Get beginning of next week (Monday 9 AM)"""
-        now = datetime.now(pytz.timezone(self.context.user_timezone))
+        now = datetime.now(self.context.tz)
         days_until_monday = 7 - now.weekday()
         monday = now + timedelta(days=days_until_monday)
         return monday.replace(
@@ -433,13 +663,45 @@ Keep responses concise but informative."""),
 
     def _check_business_hours(self, dt: datetime) -> bool:
         """Check if datetime falls within business hours"""
-        time_of_day = dt.time()
-        return self.context.business_hours_start <= time_of_day <= self.context.business_hours_end
+        start_minutes, end_minutes = self.context.business_minutes
+        return start_minutes <= dt.hour * 60 + dt.minute <= end_minutes
 
-    def _suggest_alternative_times(self, requested_time: datetime, duration: int, flexibility: str) -> List[datetime]:
-        """Suggest alternative time slots when requested time is busy"""
-        suggestions = []
+    def _business_day_grid(self, day: datetime, step_minutes: int, duration: int) -> np.ndarray:
+        """Epoch-second slot starts within the business hours of `day` that leave room for `duration` minutes"""
+        day_start = day.replace(
+            hour=self.context.business_hours_start.hour,
+            minute=self.context.business_hours_start.minute,
+            second=0, microsecond=0
+        )
+        day_end = day.replace(
+            hour=self.context.business_hours_end.hour,
+            minute=self.context.business_hours_end.minute,
+            second=0, microsecond=0
+        )
+        return np.arange(
+            int(day_start.timestamp()),
+            int(day_end.timestamp()) - duration * 60 + 1,
+            step_minutes * 60,
+            dtype=np.int64
+        )
+
+    @staticmethod
+    def _free_slots(slots: np.ndarray, duration: int, busy: List[Tuple[datetime, datetime]], tz, limit: int) -> List[datetime]:
+        """Return up to `limit` slot starts from an epoch-second grid that don't overlap any busy interval"""
+        if not busy:
+            # Empty calendar: every slot is free, no overlap test needed
+            return [datetime.fromtimestamp(int(ts), tz) for ts in slots[:limit]]
+        
+        busy_starts = np.fromiter((int(start.timestamp()) for start, _ in busy), dtype=np.int64, count=len(busy))
+        busy_ends = np.fromiter((int(end.timestamp()) for _, end in busy), dtype=np.int64, count=len(busy))
         
+        # (slots x busy) overlap matrix in one broadcast comparison
+        conflict = ((slots[:, None] + duration * 60 > busy_starts) & (slots[:, None] < busy_ends)).any(axis=1)
+        
+        return [datetime.fromtimestamp(int(ts), tz) for ts in slots[~conflict][:limit]]
+
+    async def _suggest_alternative_times(self, requested_time: datetime, duration: int, flexibility: str) -> List[datetime]:
+        """Suggest alternative time slots when requested time is busy"""
         if flexibility == "very_flexible":
             search_days = 14
             time_increments = [30, 60, 120]  # 30min, 1hr, 2hr intervals
@@ -452,50 +714,39 @@ Keep responses concise but informative."""),
         
         base_time = requested_time
         
-        for day_offset in range(search_days):
-            current_day = base_time + timedelta(days=day_offset)
-            
-            # Only suggest times within business hours
-            start_time = current_day.replace(
-                hour=self.context.business_hours_start.hour,
-                minute=self.context.business_hours_start.minute
+        # Day 0 is searched at the finest increment, later days at the coarsest
+        slots = np.concatenate([
+            self._business_day_grid(
+                base_time + timedelta(days=day_offset),
+                time_increments[0] if day_offset == 0 else time_increments[-1],
+                duration
             )
-            end_time = current_day.replace(
-                hour=self.context.business_hours_end.hour,
-                minute=self.context.business_hours_end.minute
-            )
-            
-            current_time = start_time
-            while current_time + timedelta(minutes=duration) <= end_time:
-                if self.calendar_service.check_availability(current_time, duration):
-                    suggestions.append(current_time)
-                    if len(suggestions) >= 5:  
-                        return suggestions
-                
-                increment = time_increments[0] if day_offset == 0 else time_increments[-1]
-                current_time += timedelta(minutes=increment)
+            for day_offset in range(search_days)
+        ])
+        if len(slots) == 0:
+            return []
         
-        return suggestions
+        # One freebusy query covers the whole search window
+        busy = await self.calendar_service.get_busy_intervals(
+            datetime.fromtimestamp(int(slots[0]), base_time.tzinfo),
+            datetime.fromtimestamp(int(slots[-1]) + duration * 60, base_time.tzinfo)
+        )
+        if busy is None:
+            return []
+        
+        return self._free_slots(slots, duration, busy, base_time.tzinfo, limit=5)
 
-    def _handle_booking_request(self, request: ParsedBookingRequest) -> str:
+    async def _handle_booking_request(self, request: ParsedBookingRequest) -> str:
         """Handle a booking request with intelligent scheduling"""
         try:
             if not request.start_time:
-                return self._generate_response(
-                    "unclear_time",
-                    f"I'd be happy to book a {request.summary.lower()} for you! Could you please specify when you'd like to schedule it? You can say things like 'tomorrow at 3pm', 'next Monday at 10am', or 'in 2 hours'.",
-                    request
-                )
+                return f"I'd be happy to book a {request.summary.lower()} for you! Could you please specify when you'd like to schedule it? You can say things like 'tomorrow at 3pm', 'next Monday at 10am', or 'in 2 hours'."
             
             if not self._check_business_hours(request.start_time):
-                return self._generate_response(
-                    "outside_business_hours",
-                    f"The requested time ({request.start_time.strftime('%A, %B %d at %I:%M %p')}) is outside business hours ({self.context.business_hours_start.strftime('%I:%M %p')} - {self.context.business_hours_end.strftime('%I:%M %p')}). Would you like me to suggest times during business hours?",
-                    request
-                )
+                return f"The requested time ({format_meeting_time(request.start_time)}) is outside business hours ({format_clock_time(self.context.business_hours_start)} - {format_clock_time(self.context.business_hours_end)}). Would you like me to suggest times during business hours?"
             
-            if self.calendar_service.check_availability(request.start_time, request.duration):
-                result = self.calendar_service.create_event(
+            if await self.calendar_service.check_availability(request.start_time, request.duration):
+                result = await self.calendar_service.create_event(
                     request.summary,
                     request.start_time,
                     request.duration,
@@ -505,14 +756,10 @@ Keep responses concise but informative."""),
                 self.context.last_intent = Intent.BOOK_MEETING
                 self.context.pending_booking = None
                 
-                return self._generate_response(
-                    "booking_successful",
-                    f"Perfect! I've successfully booked your {request.summary.lower()} for {request.start_time.strftime('%A, %B %d at %I:%M %p')} ({request.duration} minutes). You should receive a calendar invitation shortly.",
-                    request
-                )
+                return f"Perfect! I've successfully booked your {request.summary.lower()} for {format_meeting_time(request.start_time)} ({request.duration} minutes). You should receive a calendar invitation shortly."
             
             else:
-                alternatives = self._suggest_alternative_times(
+                alternatives = await self._suggest_alternative_times(
                     request.start_time, 
                     request.duration, 
                     request.flexibility
@@ -522,42 +769,41 @@ Keep responses concise but informative."""),
                     self.context.pending_booking = request.__dict__
                     
                     alt_text = "\n".join([
-                        f"• {alt.strftime('%A, %B %d at %I:%M %p')}"
+                        f"• {format_meeting_time(alt)}"
                         for alt in alternatives[:3]
                     ])
                     
-                    return self._generate_response(
-                        "time_conflict_with_alternatives",
-                        f"I'm sorry, but {request.start_time.strftime('%A, %B %d at %I:%M %p')} is already booked. Here are some available alternatives:\n\n{alt_text}\n\nWould any of these work for you? Just let me know which one you prefer!",
-                        request
-                    )
+                    # Returned verbatim: it lists the exact slots the user picks from
+                    return f"I'm sorry, but {format_meeting_time(request.start_time)} is already booked. Here are some available alternatives:\n\n{alt_text}\n\nWould any of these work for you? Just let me know which one you prefer!"
                 else:
-                    return self._generate_response(
-                        "no_alternatives",
-                        f"Unfortunately, {request.start_time.strftime('%A, %B %d at %I:%M %p')} is already booked, and I couldn't find any suitable alternatives in the next few days. Could you suggest a different time or date range?",
-                        request
-                    )
+                    return f"Unfortunately, {format_meeting_time(request.start_time)} is already booked, and I couldn't find any suitable alternatives in the next few days. Could you suggest a different time or date range?"
                     
         except Exception as e:
             logger.error(f"Error handling booking request: {e}")
             return "I encountered an error while processing your booking request. Please try again or contact support if the issue persists."
 
-    def _handle_availability_check(self, user_input: str) -> str:
+    async def _handle_availability_check(self, user_input: str) -> str:
         """Handle availability check requests"""
         try:
             time_slots = self._extract_time_range(user_input)
-            if not time_slots:
+            if len(time_slots) == 0:
                 return "I'd be happy to check your availability! Please specify a time range, like 'What's available tomorrow afternoon?' or 'Show me free slots next week'."
             
-            available_slots = []
-            for slot_start in time_slots:
-                if self.calendar_service.check_availability(slot_start, self.context.preferred_meeting_duration):
-                    available_slots.append(slot_start)
+            tz = self.context.tz
+            duration = self.context.preferred_meeting_duration
+            busy = await self.calendar_service.get_busy_intervals(
+                datetime.fromtimestamp(int(time_slots[0]), tz),
+                datetime.fromtimestamp(int(time_slots[-1]) + duration * 60, tz)
+            )
+            if busy is None:
+                return "I encountered an error while checking availability. Please try again."
+            
+            available_slots = self._free_slots(time_slots, duration, busy, tz, limit=10)
             
             if available_slots:
                 slots_text = "\n".join([
-                    f"• {slot.strftime('%A, %B %d at %I:%M %p')}"
-                    for slot in available_slots[:10]  
+                    f"• {format_meeting_time(slot)}"
+                    for slot in available_slots
                 ])
                 return f"Here are your available time slots:\n\n{slots_text}\n\nWould you like to book any of these times?"
             else:
@@ -567,72 +813,24 @@ Keep responses concise but informative."""),
             logger.error(f"Error checking availability: {e}")
             return "I encountered an error while checking availability. Please try again."
 
-    def _extract_time_range(self, user_input: str) -> List[datetime]:
-        """Extract time range for availability checks"""
-        now = datetime.now(pytz.timezone(self.context.user_timezone))
-        slots = []
+    def _extract_time_range(self, user_input: str) -> np.ndarray:
+        """Extract candidate slot starts (epoch seconds) for availability checks"""
+        now = datetime.now(self.context.tz)
+        duration = self.context.preferred_meeting_duration
         
         if "tomorrow" in user_input.lower():
-            tomorrow = now + timedelta(days=1)
-            start_time = tomorrow.replace(
-                hour=self.context.business_hours_start.hour,
-                minute=self.context.business_hours_start.minute
-            )
-            
-            current = start_time
-            end_of_day = tomorrow.replace(
-                hour=self.context.business_hours_end.hour,
-                minute=self.context.business_hours_end.minute
-            )
-            
-            while current < end_of_day:
-                slots.append(current)
-                current += timedelta(hours=1)
+            return self._business_day_grid(now + timedelta(days=1), 60, duration)
         
         elif "next week" in user_input.lower():
             next_monday = now + timedelta(days=(7 - now.weekday()))
-            for day in range(5):  
-                day_start = (next_monday + timedelta(days=day)).replace(
-                    hour=self.context.business_hours_start.hour,
-                    minute=self.context.business_hours_start.minute
-                )
-                
-                current = day_start
-                day_end = day_start.replace(
-                    hour=self.context.business_hours_end.hour,
-                    minute=self.context.business_hours_end.minute
-                )
-                
-                while current < day_end:
-                    slots.append(current)
-                    current += timedelta(hours=2)  
+            return np.concatenate([
+                self._business_day_grid(next_monday + timedelta(days=day), 120, duration)
+                for day in range(5)
+            ])
         
-        return slots
+        return np.empty(0, dtype=np.int64)
 
-    def _generate_response(self, situation: str, default_response: str, context_data=None) -> str:
-        """Generate contextual responses using LLM"""
-        try:
-            context_str = json.dumps({
-                "conversation_history": self.context.conversation_history[-3:],
-                "user_timezone": self.context.user_timezone,
-                "business_hours": f"{self.context.business_hours_start} - {self.context.business_hours_end}"
-            })
-            
-            response = self.response_chain.invoke({
-                "situation": situation,
-                "user_input": self.context.conversation_history[-1]["user"] if self.context.conversation_history else "",
-                "agent_action": situation,
-                "result": default_response,
-                "context": context_str
-            }).content
-            
-            return response.strip()
-            
-        except Exception as e:
-            logger.error(f"Error generating response: {e}")
-            return default_response
-
-    def run(self, user_input: str) -> str:
+    async def run(self, user_input: str) -> str:
         """Main entry point for processing user requests"""
         try:
             self.context.conversation_history.append({
@@ -640,33 +838,38 @@ Keep responses concise but informative."""),
                 "timestamp": datetime.now().isoformat()
             })
             
-            if len(self.context.conversation_history) > 10:
-                self.context.conversation_history = self.context.conversation_history[-10:]
-            
-            intent = self._recognize_intent(user_input)
+            booking_request = None
+            intent = self._fast_intent(user_input)
+            if intent is None:
+                # Extract booking details speculatively while the LLM classifies the intent
+                intent, booking_request = await asyncio.gather(
+                    self._recognize_intent(user_input),
+                    self._extract_booking_details(user_input)
+                )
             logger.info(f"Recognized intent: {intent.value}")
             
             if intent == Intent.GREETING:
                 response = "Hello! I'm your AI scheduling assistant. I can help you book meetings, check your availability, and manage your calendar. What would you like to do today?"
             
             elif intent == Intent.BOOK_MEETING:
-                booking_request = self._extract_booking_details(user_input)
-                response = self._handle_booking_request(booking_request)
+                if booking_request is None:
+                    booking_request = await self._extract_booking_details(user_input)
+                response = await self._handle_booking_request(booking_request)
             
             elif intent == Intent.CHECK_AVAILABILITY:
-                response = self._handle_availability_check(user_input)
+                response = await self._handle_availability_check(user_input)
             
             elif intent == Intent.LIST_MEETINGS:
-                response = self._handle_list_meetings()
+                response = await self._handle_list_meetings()
             
             elif intent == Intent.CANCEL_MEETING:
-                response = self._handle_cancel_meeting(user_input)
+                response = await self._handle_cancel_meeting(user_input)
             
             elif intent == Intent.RESCHEDULE_MEETING:
-                response = self._handle_reschedule_meeting(user_input)
+                response = await self._handle_reschedule_meeting(user_input, booking_request)
             
             else:  # UNCLEAR or other
-                response = self._handle_unclear_request(user_input)
+                response = await self._handle_unclear_request(user_input)
             
             self.context.conversation_history[-1]["assistant"] = response
             self.context.last_intent = intent
@@ -677,22 +880,22 @@ Keep responses concise but informative."""),
             logger.error(f"Error in main run method: {e}")
             return "I apologize, but I encountered an unexpected error. Please try rephrasing your request or contact support if the issue persists."
 
-    def _handle_list_meetings(self) -> str:
+    async def _handle_list_meetings(self) -> str:
         """Handle requests to list upcoming meetings"""
         try:
-            upcoming_meetings = self.calendar_service.get_upcoming_events(limit=10)
+            upcoming_meetings = await self.calendar_service.get_upcoming_events(limit=10)
             
             if not upcoming_meetings:
                 return "You don't have any upcoming meetings scheduled. Would you like to book a new one?"
             
             meetings_text = "Here are your upcoming meetings:\n\n"
             for i, meeting in enumerate(upcoming_meetings, 1):
-                start_time = meeting.get('start_time')
-                title = meeting.get('summary', 'Untitled Meeting')
-                duration = meeting.get('duration', 'Unknown duration')
+                start_time = meeting.start_time
+                title = meeting.summary
+                duration = meeting.duration
                 
                 if start_time:
-                    meetings_text += f"{i}. **{title}**\n   📅 {start_time.strftime('%A, %B %d at %I:%M %p')}\n   ⏱️ {duration} minutes\n\n"
+                    meetings_text += f"{i}. **{title}**\n   📅 {format_meeting_time(start_time)}\n   ⏱️ {duration} minutes\n\n"
             
             return meetings_text + "Would you like to reschedule or cancel any of these meetings?"
             
@@ -700,7 +903,7 @@ Keep responses concise but informative."""),
             logger.error(f"Error listing meetings: {e}")
             return "I'm having trouble accessing your calendar right now. Please try again in a moment."
 
-    def _handle_cancel_meeting(self, user_input: str) -> str:
+    async def _handle_cancel_meeting(self, user_input: str) -> str:
         """Handle meeting cancellation requests"""
         try:
             meeting_info = self._extract_meeting_reference(user_input)
@@ -708,7 +911,7 @@ Keep responses concise but informative."""),
             if not meeting_info:
                 return "I'd be happy to help cancel a meeting! Could you please specify which meeting you'd like to cancel? You can mention the time, title, or say something like 'cancel my 3pm meeting tomorrow'."
             
-            cancelled = self.calendar_service.cancel_event(meeting_info)
+            cancelled = await self.calendar_service.cancel_event(meeting_info)
             
             if cancelled:
                 return f"I've successfully cancelled your meeting. You should receive a cancellation notification shortly."
@@ -719,11 +922,12 @@ Keep responses concise but informative."""),
             logger.error(f"Error cancelling meeting: {e}")
             return "I encountered an error while trying to cancel the meeting. Please try again or contact support."
 
-    def _handle_reschedule_meeting(self, user_input: str) -> str:
+    async def _handle_reschedule_meeting(self, user_input: str, new_time_info: Optional[ParsedBookingRequest] = None) -> str:
         """Handle meeting rescheduling requests"""
         try:
             meeting_info = self._extract_meeting_reference(user_input)
-            new_time_info = self._extract_booking_details(user_input)
+            if new_time_info is None:
+                new_time_info = await self._extract_booking_details(user_input)
             
             if not meeting_info:
                 return "I'd be happy to help reschedule a meeting! Please specify which meeting you'd like to reschedule and the new time. For example: 'reschedule my 3pm meeting to 4pm tomorrow'."
@@ -732,17 +936,21 @@ Keep responses concise but informative."""),
                 self.context.pending_booking = {"action": "reschedule", "meeting": meeting_info}
                 return f"I found the meeting you want to reschedule. What's the new time you'd prefer?"
             
-            if self.calendar_service.check_availability(new_time_info.start_time, new_time_info.duration):
-                success = self.calendar_service.reschedule_event(meeting_info, new_time_info.start_time, new_time_info.duration)
+            if await self.calendar_service.check_availability(new_time_info.start_time, new_time_info.duration):
+                success = await self.calendar_service.reschedule_event(
+                    meeting_info, new_time_info.start_time, new_time_info.duration
+                )
                 
                 if success:
-                    return f"Perfect! I've rescheduled your meeting to {new_time_info.start_time.strftime('%A, %B %d at %I:%M %p')}. All attendees will be notified of the change."
+                    return f"Perfect! I've rescheduled your meeting to {format_meeting_time(new_time_info.start_time)}. All attendees will be notified of the change."
                 else:
                     return "I had trouble rescheduling the meeting. Please check the meeting details and try again."
             else:
-                alternatives = self._suggest_alternative_times(new_time_info.start_time, new_time_info.duration, "flexible")
+                alternatives = await self._suggest_alternative_times(
+                    new_time_info.start_time, new_time_info.duration, "flexible"
+                )
                 if alternatives:
-                    alt_text = "\n".join([f"• {alt.strftime('%A, %B %d at %I:%M %p')}" for alt in alternatives[:3]])
+                    alt_text = "\n".join([f"• {format_meeting_time(alt)}" for alt in alternatives[:3]])
                     return f"The requested new time is not available. Here are some alternatives:\n\n{alt_text}\n\nWhich time works best for you?"
                 else:
                     return "The requested time isn't available and I couldn't find suitable alternatives. Could you suggest a different time?"
@@ -753,27 +961,20 @@ Keep responses concise but informative."""),
 
     def _extract_meeting_reference(self, user_input: str) -> Optional[Dict]:
         """Extract meeting reference from user input for cancellation/rescheduling"""
-        patterns = [
-            r'(\d{1,2}:\d{2})\s*(am|pm)?',  
-            r'(tomorrow|today|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',  
-            r'meeting with (\w+)',  
-            r'(\w+) meeting'  
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, user_input.lower())
+        for reference_type, pattern in _MEETING_REFERENCE_PATTERNS:
+            match = pattern.search(user_input)
             if match:
-                return {"reference": match.group(0), "type": "pattern_match"}
+                return {"reference": match.group(0).lower(), "type": reference_type}
         
         return None
 
-    def _handle_unclear_request(self, user_input: str) -> str:
+    async def _handle_unclear_request(self, user_input: str) -> str:
         """Handle unclear or ambiguous requests"""
+        from langchain_core.messages import HumanMessage, SystemMessage
+        
         try:
-            clarification_prompt = ChatPromptTemplate.from_messages([
-                SystemMessage(content="""The user said: "{user_input}"
-
-This is unclear in the context of calendar booking. Generate a helpful response that:
+            clarification_messages = [
+                SystemMessage(content="""The user's message is unclear in the context of calendar booking. Generate a helpful response that:
 1. Acknowledges their input
 2. Asks for clarification
 3. Provides examples of what they can ask for
@@ -781,9 +982,9 @@ This is unclear in the context of calendar booking. Generate a helpful response
 
 Keep it concise and actionable."""),
                 HumanMessage(content=user_input)
-            ])
+            ]
             
-            response = self.llm.invoke(clarification_prompt).content.strip()
+            response = (await self.llm_small.ainvoke(clarification_messages)).content.strip()
             return response
             
         except Exception as e:
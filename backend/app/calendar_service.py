@@ -1,20 +1,61 @@
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from app.config import Config
 from app.logging_config import logger
-import os
-import pytz
+import logging
+import asyncio
+import ciso8601
 from typing import List, Dict, Optional, Tuple
-import hashlib
+import threading
 import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
 from functools import lru_cache
-from dataclasses import dataclass
 
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
-@dataclass
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
+
+def format_clock_time(t) -> str:
+    """Equivalent of strftime('%I:%M %p') for a time or datetime, without the locale machinery"""
+    return f"{t.hour % 12 or 12:02d}:{t.minute:02d} {'AM' if t.hour < 12 else 'PM'}"
+
+def format_meeting_time(dt: datetime) -> str:
+    """Equivalent of strftime('%A, %B %d at %I:%M %p') built from name tables"""
+    return f"{_WEEKDAY_NAMES[dt.weekday()]}, {_MONTH_NAMES[dt.month - 1]} {dt.day:02d} at {format_clock_time(dt)}"
+
+def _tz_name(dt: datetime) -> str:
+    """IANA zone name of an aware datetime (zoneinfo or pytz), defaulting to UTC"""
+    return getattr(dt.tzinfo, 'key', None) or getattr(dt.tzinfo, 'zone', None) or 'UTC'
+
+@lru_cache(maxsize=1)
+def _load_credentials():
+    """Service account credentials, read from disk once per process"""
+    from google.oauth2 import service_account
+    
+    return service_account.Credentials.from_service_account_file(
+        Config.SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+
+def _orjson_model():
+    """googleapiclient JSON model that decodes response bodies with orjson instead of json"""
+    import orjson
+    from googleapiclient.model import JsonModel
+    
+    class OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return content.decode('utf-8') if isinstance(content, bytes) else content
+            if self._data_wrapper and 'data' in body:
+                body = body['data']
+            return body
+    
+    return OrjsonModel()
+
+@dataclass(slots=True)
 class CalendarEvent:
     """Structured representation of a calendar event"""
     id: str
@@ -25,27 +66,51 @@ class CalendarEvent:
     attendees: List[str] = None
     location: str = ""
     status: str = "confirmed"
+    duration: int = field(init=False)
+    # Lowercased once at construction for reference matching in cancel/reschedule
+    _summary_lower: str = field(init=False, repr=False)
+    _time_str_lower: str = field(init=False, repr=False)
     
     def __post_init__(self):
         if self.attendees is None:
             self.attendees = []
+        self.duration = int((self.end_time - self.start_time).total_seconds() / 60)
+        self._summary_lower = self.summary.lower()
+        self._time_str_lower = format_clock_time(self.start_time).lower()
 
 class EnhancedCalendarService:
     """Enhanced calendar service with advanced features and optimizations"""
     
     def __init__(self):
         try:
-            if not os.path.exists(Config.SERVICE_ACCOUNT_FILE):
-                raise FileNotFoundError(f"Service account file not found: {Config.SERVICE_ACCOUNT_FILE}")
-            
-            credentials = service_account.Credentials.from_service_account_file(
-                Config.SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-            self.service = build('calendar', 'v3', credentials=credentials)
-            
-            self._events_cache = {}
-            self._cache_expiry = {}
+            # Deferred so importing the app doesn't load the Google client libraries
+            from googleapiclient.discovery import build
+            
+            credentials = _load_credentials()
+            # Use the discovery document bundled with the client instead of fetching it
+            self.service = build('calendar', 'v3', credentials=credentials, model=_orjson_model(),
+                                 static_discovery=True, cache_discovery=False)
+            self._credentials = credentials
+            # httplib2 connections are not thread-safe; each worker thread gets its own
+            # persistent connection, reused across calls from that thread
+            self._thread_local = threading.local()
+            self._http_timeout = 10
+            
+            # cache key -> (expiry timestamp, value)
+            self._events_cache: Dict[Tuple, Tuple[float, object]] = {}
             self._cache_duration = 300  # 5 minutes
             
+            # Busy intervals for [today, today + horizon] sorted by start, with running max of ends
+            self._busy_horizon_days = 30
+            self._busy_intervals: List[Tuple[datetime, datetime]] = []
+            self._busy_starts: List[datetime] = []
+            self._busy_max_ends: List[datetime] = []
+            self._busy_window: Optional[Tuple[datetime, datetime]] = None
+            self._busy_expiry = 0
+            self._busy_lock = threading.Lock()
+            # Bumped by every index mutation so a reload started before one is not installed
+            self._busy_generation = 0
+            
             self._last_request_time = 0
             self._min_request_interval = 0.1  # 100ms between requests
             
@@ -66,36 +131,132 @@ class EnhancedCalendarService:
         
         self._last_request_time = time.time()
 
-    def _get_cache_key(self, method: str, **kwargs) -> str:
+    async def _rate_limit_async(self):
+        """Non-blocking rate limiting; each caller reserves the next free request slot"""
+        current_time = time.time()
+        wait = self._min_request_interval - (current_time - self._last_request_time)
+        self._last_request_time = current_time + max(wait, 0)
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _http(self):
+        """Authorized HTTP transport for the calling thread"""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+            
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http(timeout=self._http_timeout))
+            self._thread_local.http = http
+        return http
+
+    async def _execute(self, request):
+        """Run a googleapiclient request in a worker thread without blocking the event loop"""
+        await self._rate_limit_async()
+        # blocking: HTTP round-trip on httplib2
+        return await asyncio.to_thread(lambda: request.execute(http=self._http()))
+
+    def _get_cache_key(self, method: str, **kwargs) -> Tuple[str, Tuple]:
         """Generate cache key for method calls"""
-        key_data = f"{method}:{sorted(kwargs.items())}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return (method, tuple(sorted(kwargs.items())))
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached data is still valid"""
-        if cache_key not in self._cache_expiry:
-            return False
-        return time.time() < self._cache_expiry[cache_key]
+    def _get_cache(self, cache_key: Tuple[str, Tuple]):
+        """Return cached data if present and unexpired, else None"""
+        entry = self._events_cache.get(cache_key)
+        if entry is None or time.time() >= entry[0]:
+            return None
+        return entry[1]
 
-    def _set_cache(self, cache_key: str, data):
+    def _set_cache(self, cache_key: Tuple[str, Tuple], data):
         """Set cache with expiry time"""
-        self._events_cache[cache_key] = data
-        self._cache_expiry[cache_key] = time.time() + self._cache_duration
+        self._events_cache[cache_key] = (time.time() + self._cache_duration, data)
 
-    @lru_cache(maxsize=100)
     def _parse_datetime(self, dt_string: str) -> datetime:
-        """Parse datetime string with caching"""
+        """Parse an RFC 3339 dateTime or an all-day date (taken as UTC midnight)"""
         try:
-            if 'T' in dt_string:
-                return datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
-            else:
-                date_obj = datetime.fromisoformat(dt_string)
-                return pytz.UTC.localize(date_obj)
+            parsed = ciso8601.parse_datetime(dt_string)
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=timezone.utc)
+            return parsed
         except Exception as e:
             logger.error(f"Error parsing datetime {dt_string}: {e}")
             return None
 
-    def check_availability(self, start_time: datetime, duration_minutes: int, 
+    def _reindex_busy(self):
+        """Rebuild the start keys and running max of ends after the interval list changes"""
+        self._busy_starts = [busy_start for busy_start, _ in self._busy_intervals]
+        self._busy_max_ends = []
+        for _, busy_end in self._busy_intervals:
+            self._busy_max_ends.append(
+                max(busy_end, self._busy_max_ends[-1]) if self._busy_max_ends else busy_end
+            )
+
+    def _refresh_busy_index(self) -> bool:
+        """Reload the busy index from the API; returns False if it could not be refreshed
+        
+        The fetch runs without holding _busy_lock, because _add_busy/_remove_busy take that
+        lock on the event loop thread. A result is discarded if the index was changed while
+        it was in flight, since it may predate that change.
+        """
+        with self._busy_lock:
+            generation = self._busy_generation
+        
+        window_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        window_end = window_start + timedelta(days=self._busy_horizon_days)
+        try:
+            intervals = sorted(self._fetch_busy_times(window_start, window_end))
+        except Exception as e:
+            logger.error(f"Error loading busy interval index: {e}")
+            with self._busy_lock:
+                self._busy_window = None
+            return False
+        
+        with self._busy_lock:
+            if self._busy_generation != generation:
+                return False
+            self._busy_intervals = intervals
+            self._reindex_busy()
+            self._busy_window = (window_start, window_end)
+            self._busy_expiry = time.time() + self._cache_duration
+        logger.info(f"Loaded {len(intervals)} busy intervals for the next {self._busy_horizon_days} days")
+        return True
+
+    def _is_busy(self, start_time: datetime, end_time: datetime) -> bool:
+        """O(log n) overlap query against the busy index"""
+        # Intervals starting before end_time are [0, i); any of them overlaps if the latest end passes start_time
+        i = bisect_left(self._busy_starts, end_time)
+        return i > 0 and self._busy_max_ends[i - 1] > start_time
+
+    def _indexed_availability(self, start_time: datetime, end_time: datetime) -> Optional[bool]:
+        """Availability from the busy index, or None when the range is outside the indexed window"""
+        with self._busy_lock:
+            stale = self._busy_window is None or time.time() >= self._busy_expiry
+        if stale and not self._refresh_busy_index():
+            return None
+        
+        with self._busy_lock:
+            if self._busy_window is None or not (self._busy_window[0] <= start_time and end_time <= self._busy_window[1]):
+                return None
+            return not self._is_busy(start_time, end_time)
+
+    def _add_busy(self, start_time: datetime, end_time: datetime):
+        """Record a new busy interval in the index"""
+        with self._busy_lock:
+            self._busy_generation += 1
+            if self._busy_window is not None:
+                insort(self._busy_intervals, (start_time, end_time))
+                self._reindex_busy()
+
+    def _remove_busy(self, start_time: datetime, end_time: datetime):
+        """Drop a busy interval from the index"""
+        with self._busy_lock:
+            self._busy_generation += 1
+            if self._busy_window is not None and (start_time, end_time) in self._busy_intervals:
+                self._busy_intervals.remove((start_time, end_time))
+                self._reindex_busy()
+
+    async def check_availability(self, start_time: datetime, duration_minutes: int, 
                           buffer_minutes: int = 0) -> bool:
         """
         Enhanced availability checking with buffer time and conflict detection
@@ -106,50 +267,39 @@ class EnhancedCalendarService:
             buffer_minutes: Buffer time before/after meetings (default: 0)
         """
         try:
-            self._rate_limit()
-            
             buffer_delta = timedelta(minutes=buffer_minutes)
             check_start = start_time - buffer_delta
             end_time = start_time + timedelta(minutes=duration_minutes)
             check_end = end_time + buffer_delta
             
-            cache_key = self._get_cache_key(
-                "check_availability",
-                start=check_start.isoformat(),
-                end=check_end.isoformat()
-            )
+            # blocking: a stale index is reloaded with a freebusy API call
+            is_available = await asyncio.to_thread(self._indexed_availability, check_start, check_end)
+            if is_available is not None:
+                logger.info(f"Availability check (indexed) for {start_time} ({duration_minutes}min): {'Available' if is_available else 'Busy'}")
+                return is_available
             
-            if self._is_cache_valid(cache_key):
-                result = self._events_cache[cache_key]
-                logger.info(f"Availability check (cached): {result}")
-                return result
-            
-            events_result = self.service.events().list(
+            # Outside the indexed window: ask the API directly. One non-cancelled event
+            # is enough to answer, so only the first match's status is fetched.
+            events_result = await self._execute(self.service.events().list(
                 calendarId=Config.GOOGLE_CALENDAR_ID,
                 timeMin=check_start.isoformat(),
                 timeMax=check_end.isoformat(),
                 singleEvents=True,
                 orderBy='startTime',
-                fields='items(id,summary,start,end,status)'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            
-            active_events = [
-                event for event in events 
-                if event.get('status', '').lower() != 'cancelled'
-            ]
-            
-            is_available = len(active_events) == 0
-            
-            self._set_cache(cache_key, is_available)
+                maxResults=1,
+                maxAttendees=1,
+                fields='items(status)'
+            ))
+            
+            is_available = not any(
+                event.get('status', '').lower() != 'cancelled'
+                for event in events_result.get('items', [])
+            )
             
             logger.info(f"Availability check for {start_time} ({duration_minutes}min): {'Available' if is_available else 'Busy'}")
             
-            if not is_available:
-                for event in active_events:
-                    event_start = self._parse_datetime(event['start'].get('dateTime', event['start'].get('date')))
-                    logger.info(f"Conflict with: {event.get('summary', 'Untitled')} at {event_start}")
+            if not is_available and logger.isEnabledFor(logging.DEBUG):
+                await self._log_conflicts(check_start, check_end)
             
             return is_available
             
@@ -160,15 +310,31 @@ class EnhancedCalendarService:
             logger.error(f"Error checking availability: {e}")
             return False
 
-    def create_event(self, summary: str, start_time: datetime, duration_minutes: int, 
+    async def _log_conflicts(self, start_time: datetime, end_time: datetime):
+        """Log every event overlapping a range; only worth the extra fetch when debugging"""
+        events_result = await self._execute(self.service.events().list(
+            calendarId=Config.GOOGLE_CALENDAR_ID,
+            timeMin=start_time.isoformat(),
+            timeMax=end_time.isoformat(),
+            singleEvents=True,
+            orderBy='startTime',
+            maxAttendees=1,
+            fields='items(summary,start,status)'
+        ))
+        
+        for event in events_result.get('items', []):
+            if event.get('status', '').lower() == 'cancelled':
+                continue
+            event_start = self._parse_datetime(event['start'].get('dateTime', event['start'].get('date')))
+            logger.debug(f"Conflict with: {event.get('summary', 'Untitled')} at {event_start}")
+
+    async def create_event(self, summary: str, start_time: datetime, duration_minutes: int, 
                     description: str = "", attendees: List[str] = None, 
                     location: str = "", send_notifications: bool = True) -> str:
         """
         Enhanced event creation with rich metadata and notification options
         """
         try:
-            self._rate_limit()
-            
             end_time = start_time + timedelta(minutes=duration_minutes)
             
             event_data = {
@@ -176,11 +342,11 @@ class EnhancedCalendarService:
                 'description': description,
                 'start': {
                     'dateTime': start_time.isoformat(),
-                    'timeZone': start_time.tzinfo.zone if start_time.tzinfo else 'UTC'
+                    'timeZone': _tz_name(start_time)
                 },
                 'end': {
                     'dateTime': end_time.isoformat(),
-                    'timeZone': end_time.tzinfo.zone if end_time.tzinfo else 'UTC'
+                    'timeZone': _tz_name(end_time)
                 },
                 'status': 'confirmed'
             }
@@ -194,16 +360,17 @@ class EnhancedCalendarService:
             metadata = f"\n\n--- Event Details ---\nDuration: {duration_minutes} minutes\nCreated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC\nCreated by: AI Scheduling Assistant"
             event_data['description'] = f"{description}{metadata}"
             
-            created_event = self.service.events().insert(
+            created_event = await self._execute(self.service.events().insert(
                 calendarId=Config.GOOGLE_CALENDAR_ID,
                 body=event_data,
                 sendNotifications=send_notifications
-            ).execute()
+            ))
             
             self._clear_cache_for_timerange(start_time, end_time)
+            self._add_busy(start_time, end_time)
             
             event_link = created_event.get('htmlLink', '')
-            message = f"✅ Successfully booked: {summary}\n📅 {start_time.strftime('%A, %B %d at %I:%M %p')}\n⏱️ Duration: {duration_minutes} minutes"
+            message = f"✅ Successfully booked: {summary}\n📅 {format_meeting_time(start_time)}\n⏱️ Duration: {duration_minutes} minutes"
             
             if event_link:
                 message += f"\n🔗 [View in Calendar]({event_link})"
@@ -220,35 +387,40 @@ class EnhancedCalendarService:
             logger.error(error_msg)
             return f" {error_msg}"
 
-    def get_upcoming_events(self, limit: int = 10, days_ahead: int = 30) -> List[Dict]:
+    async def get_upcoming_events(self, limit: int = 10, days_ahead: int = 30,
+                                  lightweight: bool = False) -> List[CalendarEvent]:
         """
         Get upcoming events with rich formatting and metadata
+        
+        lightweight fetches only id, summary, times and status (no description,
+        location or attendees) for callers that just match or count events.
         """
         try:
-            self._rate_limit()
-            
-            now = datetime.now(pytz.UTC)
+            now = datetime.now(timezone.utc)
             future_time = now + timedelta(days=days_ahead)
             
-            cache_key = self._get_cache_key(
-                "upcoming_events",
-                limit=limit,
-                start=now.isoformat(),
-                end=future_time.isoformat()
-            )
+            # Keyed on the window size, not its exact bounds, so repeat calls within the cache lifetime hit
+            cache_key = self._get_cache_key("upcoming_events", limit=limit, days_ahead=days_ahead,
+                                            lightweight=lightweight)
             
-            if self._is_cache_valid(cache_key):
-                return self._events_cache[cache_key]
+            cached = self._get_cache(cache_key)
+            if cached is not None:
+                return cached
             
-            events_result = self.service.events().list(
+            if lightweight:
+                field_args = {'fields': 'items(id,summary,start,end,status)', 'maxAttendees': 1}
+            else:
+                field_args = {'fields': 'items(id,summary,start,end,description,location,attendees,status)'}
+            
+            events_result = await self._execute(self.service.events().list(
                 calendarId=Config.GOOGLE_CALENDAR_ID,
                 timeMin=now.isoformat(),
                 timeMax=future_time.isoformat(),
                 maxResults=limit,
                 singleEvents=True,
                 orderBy='startTime',
-                fields='items(id,summary,start,end,description,location,attendees,status)'
-            ).execute()
+                **field_args
+            ))
             
             events = events_result.get('items', [])
             formatted_events = []
@@ -265,21 +437,19 @@ class EnhancedCalendarService:
                 )
                 
                 if start_dt and end_dt:
-                    duration = int((end_dt - start_dt).total_seconds() / 60)
-                    
-                    formatted_event = {
-                        'id': event.get('id'),
-                        'summary': event.get('summary', 'Untitled Meeting'),
-                        'start_time': start_dt,
-                        'end_time': end_dt,
-                        'duration': duration,
-                        'description': event.get('description', ''),
-                        'location': event.get('location', ''),
-                        'attendees': [
+                    formatted_event = CalendarEvent(
+                        id=event.get('id'),
+                        summary=event.get('summary', 'Untitled Meeting'),
+                        start_time=start_dt,
+                        end_time=end_dt,
+                        description=event.get('description', ''),
+                        attendees=[
                             attendee.get('email', '') 
                             for attendee in event.get('attendees', [])
-                        ]
-                    }
+                        ],
+                        location=event.get('location', ''),
+                        status=event.get('status', 'confirmed')
+                    )
                     formatted_events.append(formatted_event)
             
             self._set_cache(cache_key, formatted_events)
@@ -293,155 +463,264 @@ class EnhancedCalendarService:
             logger.error(f"Error getting upcoming events: {e}")
             return []
 
-    def cancel_event(self, event_reference: Dict) -> bool:
+    async def _batch_execute(self, requests: List) -> List[Optional[Dict]]:
+        """
+        Execute API requests in a single batch HTTP call
+        
+        Returns the responses in request order, with None for sub-requests that failed
+        """
+        results: List[Optional[Dict]] = [None] * len(requests)
+        
+        def callback(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Batch sub-request {request_id} failed: {exception}")
+                return
+            # Deletes return an empty body; record them as successful
+            results[int(request_id)] = response if response is not None else {}
+        
+        # Google limits a batch to 1000 sub-requests
+        for offset in range(0, len(requests), 1000):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for index, request in enumerate(requests[offset:offset + 1000], start=offset):
+                batch.add(request, request_id=str(index))
+            await self._execute(batch)
+        
+        return results
+
+    async def cancel_event(self, event_reference: Dict) -> bool:
         """
         Cancel an event based on various reference criteria
         """
+        return (await self.cancel_events([event_reference]))[0]
+
+    async def cancel_events(self, event_references: List[Dict]) -> List[bool]:
+        """
+        Cancel several events with one event lookup and one batched delete
+        """
         try:
-            self._rate_limit()
-            
-            event_id = self._find_event_by_reference(event_reference)
-            
-            if not event_id:
-                logger.warning(f"Could not find event to cancel: {event_reference}")
-                return False
-            
-            self.service.events().delete(
-                calendarId=Config.GOOGLE_CALENDAR_ID,
-                eventId=event_id,
-                sendNotifications=True
-            ).execute()
+            upcoming = await self.get_upcoming_events(limit=50, days_ahead=7, lightweight=True)
+            events_by_id = {event.id: event for event in upcoming}
+            event_ids = [self._find_event_by_reference(reference, upcoming) for reference in event_references]
+            
+            for reference, event_id in zip(event_references, event_ids):
+                if not event_id:
+                    logger.warning(f"Could not find event to cancel: {reference}")
+            
+            found = list(dict.fromkeys(event_id for event_id in event_ids if event_id))
+            if not found:
+                return [False] * len(event_references)
+            
+            responses = await self._batch_execute([
+                self.service.events().delete(
+                    calendarId=Config.GOOGLE_CALENDAR_ID,
+                    eventId=event_id,
+                    sendNotifications=True
+                )
+                for event_id in found
+            ])
             
             self._clear_all_caches()
             
-            logger.info(f"Event cancelled successfully: {event_id}")
-            return True
+            cancelled = dict(zip(found, (response is not None for response in responses)))
+            for event_id, success in cancelled.items():
+                if success:
+                    event = events_by_id[event_id]
+                    self._remove_busy(event.start_time, event.end_time)
+                    logger.info(f"Event cancelled successfully: {event_id}")
+            
+            return [cancelled.get(event_id, False) for event_id in event_ids]
             
         except HttpError as e:
             logger.error(f"Google Calendar API error cancelling event: {e}")
-            return False
+            return [False] * len(event_references)
         except Exception as e:
             logger.error(f"Error cancelling event: {e}")
-            return False
+            return [False] * len(event_references)
 
-    def reschedule_event(self, event_reference: Dict, new_start_time: datetime, 
+    async def reschedule_event(self, event_reference: Dict, new_start_time: datetime, 
                         new_duration: int = None) -> bool:
         """
         Reschedule an existing event to a new time
         """
+        return (await self.reschedule_events([(event_reference, new_start_time, new_duration)]))[0]
+
+    async def reschedule_events(self, changes: List[Tuple[Dict, datetime, Optional[int]]]) -> List[bool]:
+        """
+        Reschedule several events given (reference, new_start_time, new_duration) tuples
+        
+        The upcoming-events lookup already carries each event's times and description,
+        so the moves go out as one batch of patches without per-event fetches. It is the
+        full (not lightweight) fetch because the patch re-sends the description.
+        """
         try:
-            self._rate_limit()
-            
-            event_id = self._find_event_by_reference(event_reference)
-            
-            if not event_id:
-                logger.warning(f"Could not find event to reschedule: {event_reference}")
-                return False
-            
-            existing_event = self.service.events().get(
-                calendarId=Config.GOOGLE_CALENDAR_ID,
-                eventId=event_id
-            ).execute()
-            
-            if new_duration:
-                new_end_time = new_start_time + timedelta(minutes=new_duration)
-            else:
-                original_start = self._parse_datetime(
-                    existing_event['start'].get('dateTime', existing_event['start'].get('date'))
-                )
-                original_end = self._parse_datetime(
-                    existing_event['end'].get('dateTime', existing_event['end'].get('date'))
+            upcoming = await self.get_upcoming_events(limit=50, days_ahead=7)
+            events_by_id = {event.id: event for event in upcoming}
+            
+            requests = []
+            moves = []
+            event_ids = []
+            for event_reference, new_start_time, new_duration in changes:
+                event_id = self._find_event_by_reference(event_reference, upcoming)
+                event_ids.append(event_id)
+                
+                if not event_id:
+                    logger.warning(f"Could not find event to reschedule: {event_reference}")
+                    continue
+                
+                existing_event = events_by_id[event_id]
+                new_end_time = new_start_time + timedelta(
+                    minutes=new_duration if new_duration else existing_event.duration
                 )
-                original_duration = original_end - original_start
-                new_end_time = new_start_time + original_duration
-            
-            existing_event['start'] = {
-                'dateTime': new_start_time.isoformat(),
-                'timeZone': new_start_time.tzinfo.zone if new_start_time.tzinfo else 'UTC'
-            }
-            existing_event['end'] = {
-                'dateTime': new_end_time.isoformat(),
-                'timeZone': new_end_time.tzinfo.zone if new_end_time.tzinfo else 'UTC'
-            }
-            
-            current_desc = existing_event.get('description', '')
-            reschedule_note = f"\n\n--- Rescheduled ---\nMoved to: {new_start_time.strftime('%Y-%m-%d %H:%M:%S')} UTC\nRescheduled by: AI Scheduling Assistant"
-            existing_event['description'] = f"{current_desc}{reschedule_note}"
-            
-            updated_event = self.service.events().update(
-                calendarId=Config.GOOGLE_CALENDAR_ID,
-                eventId=event_id,
-                body=existing_event,
-                sendNotifications=True
-            ).execute()
+                
+                moves.append((existing_event, new_start_time, new_end_time))
+                reschedule_note = f"\n\n--- Rescheduled ---\nMoved to: {new_start_time.strftime('%Y-%m-%d %H:%M:%S')} UTC\nRescheduled by: AI Scheduling Assistant"
+                
+                requests.append(self.service.events().patch(
+                    calendarId=Config.GOOGLE_CALENDAR_ID,
+                    eventId=event_id,
+                    body={
+                        'start': {
+                            'dateTime': new_start_time.isoformat(),
+                            'timeZone': _tz_name(new_start_time)
+                        },
+                        'end': {
+                            'dateTime': new_end_time.isoformat(),
+                            'timeZone': _tz_name(new_end_time)
+                        },
+                        'description': f"{existing_event.description}{reschedule_note}"
+                    },
+                    sendNotifications=True
+                ))
+            
+            if not requests:
+                return [False] * len(changes)
+            
+            responses = await self._batch_execute(requests)
             
             self._clear_all_caches()
             
-            logger.info(f"Event rescheduled successfully: {event_id}")
-            return True
+            outcomes = iter(zip(responses, moves))
+            results = []
+            for event_id in event_ids:
+                success = False
+                if event_id:
+                    response, (existing_event, new_start_time, new_end_time) = next(outcomes)
+                    success = response is not None
+                if success:
+                    self._remove_busy(existing_event.start_time, existing_event.end_time)
+                    self._add_busy(new_start_time, new_end_time)
+                    logger.info(f"Event rescheduled successfully: {event_id}")
+                results.append(success)
+            
+            return results
             
         except HttpError as e:
             logger.error(f"Google Calendar API error rescheduling event: {e}")
-            return False
+            return [False] * len(changes)
         except Exception as e:
             logger.error(f"Error rescheduling event: {e}")
-            return False
+            return [False] * len(changes)
 
     def get_busy_times(self, start_time: datetime, end_time: datetime) -> List[Tuple[datetime, datetime]]:
         """
         Get all busy time slots in a given range
         """
         try:
+            return self._fetch_busy_times(start_time, end_time)
+        except Exception as e:
+            logger.error(f"Error getting busy times: {e}")
+            return []
+
+    def _fetch_busy_times(self, start_time: datetime, end_time: datetime) -> List[Tuple[datetime, datetime]]:
+        """Busy event intervals in a range; API errors propagate to the caller"""
+        # Follow every page; a truncated list would report occupied slots as free
+        items = []
+        page_token = None
+        while True:
             self._rate_limit()
-            
             events = self.service.events().list(
                 calendarId=Config.GOOGLE_CALENDAR_ID,
                 timeMin=start_time.isoformat(),
                 timeMax=end_time.isoformat(),
                 singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+                orderBy='startTime',
+                maxResults=2500,
+                pageToken=page_token
+            ).execute(http=self._http())
+            items.extend(events.get('items', []))
+            page_token = events.get('nextPageToken')
+            if not page_token:
+                break
+        
+        busy_times = []
+        for event in items:
+            if event.get('status', '').lower() == 'cancelled':
+                continue
             
-            busy_times = []
-            for event in events.get('items', []):
-                if event.get('status', '').lower() == 'cancelled':
-                    continue
-                
-                event_start = self._parse_datetime(
-                    event['start'].get('dateTime', event['start'].get('date'))
-                )
-                event_end = self._parse_datetime(
-                    event['end'].get('dateTime', event['end'].get('date'))
-                )
-                
-                if event_start and event_end:
-                    busy_times.append((event_start, event_end))
+            event_start = self._parse_datetime(
+                event['start'].get('dateTime', event['start'].get('date'))
+            )
+            event_end = self._parse_datetime(
+                event['end'].get('dateTime', event['end'].get('date'))
+            )
+            
+            if event_start and event_end:
+                busy_times.append((event_start, event_end))
+        
+        return busy_times
+
+    async def get_busy_intervals(self, start_time: datetime, end_time: datetime) -> Optional[List[Tuple[datetime, datetime]]]:
+        """
+        Get merged, start-sorted busy intervals for a range with a single freebusy query
+        
+        Returns None when the query fails so callers don't mistake an error for free time
+        """
+        try:
+            freebusy_result = await self._execute(self.service.freebusy().query(body={
+                'timeMin': start_time.isoformat(),
+                'timeMax': end_time.isoformat(),
+                'items': [{'id': Config.GOOGLE_CALENDAR_ID}]
+            }))
+            
+            periods = freebusy_result.get('calendars', {}).get(Config.GOOGLE_CALENDAR_ID, {}).get('busy', [])
+            intervals = sorted(
+                (self._parse_datetime(period['start']), self._parse_datetime(period['end']))
+                for period in periods
+            )
+            
+            merged = []
+            for busy_start, busy_end in intervals:
+                if merged and busy_start <= merged[-1][1]:
+                    if busy_end > merged[-1][1]:
+                        merged[-1] = (merged[-1][0], busy_end)
+                else:
+                    merged.append((busy_start, busy_end))
             
-            return busy_times
+            logger.info(f"Retrieved {len(merged)} busy intervals between {start_time} and {end_time}")
+            return merged
             
+        except HttpError as e:
+            logger.error(f"Google Calendar API error getting busy intervals: {e}")
+            return None
         except Exception as e:
-            logger.error(f"Error getting busy times: {e}")
-            return []
+            logger.error(f"Error getting busy intervals: {e}")
+            return None
 
-    def _find_event_by_reference(self, reference: Dict) -> Optional[str]:
+    def _find_event_by_reference(self, reference: Dict, recent_events: List[CalendarEvent]) -> Optional[str]:
         """
-        Find an event ID based on various reference criteria
+        Find an event ID among already-fetched events based on various reference criteria
         This is a simplified implementation - can be enhanced with fuzzy matching
         """
         try:
-            recent_events = self.get_upcoming_events(limit=50, days_ahead=7)
-            
             reference_text = reference.get('reference', '').lower()
             
-            for event in recent_events:
-                if reference_text in event['summary'].lower():
-                    return event['id']
-                
-                event_time_str = event['start_time'].strftime('%I:%M %p').lower()
-                if reference_text in event_time_str:
-                    return event['id']
-            
-            return None
+            return next(
+                (
+                    event.id for event in recent_events
+                    if reference_text in event._summary_lower or reference_text in event._time_str_lower
+                ),
+                None
+            )
             
         except Exception as e:
             logger.error(f"Error finding event by reference: {e}")
@@ -452,26 +731,24 @@ class EnhancedCalendarService:
         
         keys_to_remove = [
             key for key in self._events_cache.keys() 
-            if key.startswith('check_availability') or key.startswith('upcoming_events')
+            if key[0] in ('check_availability', 'upcoming_events')
         ]
         
         for key in keys_to_remove:
             self._events_cache.pop(key, None)
-            self._cache_expiry.pop(key, None)
 
     def _clear_all_caches(self):
         """Clear all caches"""
         self._events_cache.clear()
-        self._cache_expiry.clear()
 
-    def get_calendar_stats(self) -> Dict:
+    async def get_calendar_stats(self) -> Dict:
         """Get calendar statistics and health metrics"""
         try:
-            now = datetime.now(pytz.UTC)
+            now = datetime.now(timezone.utc)
             week_start = now - timedelta(days=now.weekday())
             week_end = week_start + timedelta(days=7)
             
-            week_events = self.get_upcoming_events(limit=100, days_ahead=7)
+            week_events = await self.get_upcoming_events(limit=100, days_ahead=7, lightweight=True)
             
             stats = {
                 'total_events_this_week': len(week_events),
@@ -490,12 +767,11 @@ class EnhancedCalendarService:
         """Clean up expired cache entries"""
         current_time = time.time()
         expired_keys = [
-            key for key, expiry_time in self._cache_expiry.items()
+            key for key, (expiry_time, _) in self._events_cache.items()
             if current_time > expiry_time
         ]
         
         for key in expired_keys:
             self._events_cache.pop(key, None)
-            self._cache_expiry.pop(key, None)
         
         logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
\ No newline at end of file
@@ -11,6 +11,9 @@ class Config:
         os.path.join(project_root, os.getenv("SERVICE_ACCOUNT_FILE", "backend/credentials/service_account.json"))
     )
     LLM_API_KEY = os.getenv("LLM_API_KEY")
+    LLM_CACHE_PATH = os.path.abspath(
+        os.path.join(project_root, os.getenv("LLM_CACHE_PATH", "backend/llm_cache.sqlite3"))
+    )
     
     @classmethod
     def validate(cls):
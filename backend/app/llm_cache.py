@@ -0,0 +1,192 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.logging_config import logger
+
+
+def normalize_input(text: str, casefold: bool = True) -> str:
+    """Normalize user input so trivially different turns share a cache entry"""
+    text = unicodedata.normalize("NFC", text).strip()
+    return text.lower() if casefold else text
+
+
+class LLMCache:
+    """Exact-match SQLite cache for LLM chain outputs with TTL and least-recently-used eviction"""
+    
+    # Chains whose output depends on the input's casing (names and titles are copied verbatim)
+    CASE_SENSITIVE_CHAINS = {"extraction"}
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0,
+                last_access REAL NOT NULL DEFAULT 0
+            )"""
+        )
+        # Caches created before last_access existed
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(llm_cache)")}
+        if "last_access" not in columns:
+            self._conn.execute("ALTER TABLE llm_cache ADD COLUMN last_access REAL NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_last_access ON llm_cache (last_access)")
+        self._conn.commit()
+        logger.info(f"LLM cache opened at {path}")
+
+    @staticmethod
+    def make_key(chain: str, model: str, temperature: float, payload: Dict) -> str:
+        """Build a deterministic SHA-256 key for a chain invocation"""
+        if "user_input" in payload:
+            casefold = chain not in LLMCache.CASE_SENSITIVE_CHAINS
+            payload = {**payload, "user_input": normalize_input(payload["user_input"], casefold)}
+
+        key_data = json.dumps(
+            {"chain": chain, "model": model, "temperature": temperature, "input": payload},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def get(self, key: str, ttl: float) -> Optional[str]:
+        """Return the cached value if present and younger than ttl seconds"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, created_at = row
+            if time.time() - created_at > ttl:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET hits = hits + 1, last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            return value
+
+    def set(self, key: str, value: str):
+        """Store a value, evicting the least recently used entries beyond max_entries"""
+        with self._lock:
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, hits, last_access) VALUES (?, ?, ?, 0, ?)",
+                (key, value, now, now)
+            )
+
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?
+                    )""",
+                    (overflow,)
+                )
+
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+
+class SemanticCache:
+    """Embedding-similarity cache that serves paraphrases of previously seen inputs
+
+    Embeddings come from a small sentence-transformers model loaded on first use.
+    If the package is not installed the cache disables itself and every lookup misses.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", threshold: float = 0.92, max_entries: int = 2000):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.enabled = True
+        self._model = None
+        self._lock = threading.Lock()
+        self._embeddings: Optional[np.ndarray] = None
+        self._scopes: List[str] = []
+        self._values: List[str] = []
+
+    def _encode(self, text: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of the normalized text, or None when embeddings are unavailable"""
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                logger.warning("sentence-transformers not installed, semantic cache disabled")
+                self.enabled = False
+                return None
+            try:
+                self._model = SentenceTransformer(self.model_name)
+            except Exception as e:
+                logger.warning(f"Could not load embedding model {self.model_name}, semantic cache disabled: {e}")
+                self.enabled = False
+                return None
+            logger.info(f"Semantic cache loaded embedding model {self.model_name}")
+
+        return self._model.encode(normalize_input(text), normalize_embeddings=True).astype(np.float32)
+
+    def get(self, text: str, scope: str = "") -> Optional[str]:
+        """Return the value stored for the most similar input in the same scope, if similar enough"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            if self._embeddings is None:
+                return None
+
+            query = self._encode(text)
+            if query is None:
+                return None
+
+            sims = self._embeddings @ query
+            sims[np.array(self._scopes) != scope] = -1.0
+            best = int(sims.argmax())
+            if sims[best] < self.threshold:
+                return None
+            return self._values[best]
+
+    def set(self, text: str, value: str, scope: str = ""):
+        """Store a value for the input, dropping the oldest entries beyond max_entries"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            embedding = self._encode(text)
+            if embedding is None:
+                return
+
+            if self._embeddings is None:
+                self._embeddings = embedding[np.newaxis, :]
+            else:
+                self._embeddings = np.vstack([self._embeddings, embedding])
+            self._scopes.append(scope)
+            self._values.append(value)
+
+            overflow = len(self._values) - self.max_entries
+            if overflow > 0:
+                self._embeddings = self._embeddings[overflow:]
+                del self._scopes[:overflow]
+                del self._values[:overflow]
@@ -1,16 +1,33 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 def setup_logging():
-    """Set up logging configuration"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler("app.log")
-        ]
-    )
+    """Set up logging configuration
+
+    Records are only enqueued on the calling thread; a background listener
+    does the actual stdout and file writes.
+    """
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler("app.log")
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Pass the bare message through; the listener's handlers apply the real format
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     return logging.getLogger(__name__)
 
 logger = setup_logging()
@@ -1,6 +1,7 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import router
+from fastapi.responses import ORJSONResponse
+from app.routes import router, init_agent, close_agent, is_rate_limited, RATE_LIMITED_PATHS
 from app.config import Config
 from app.logging_config import logger
 
@@ -8,9 +9,27 @@ from app.logging_config import logger
 app = FastAPI(
     title="AI Appointment Booking Agent",
     description="An AI-powered appointment booking system using Google Calendar",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+API_PREFIX = "/api/v1"
+# Serialized once; throttled clients get the same body every time
+_RATE_LIMITED_BODY = b'{"detail":"Too many requests. Please try again later."}'
+
+# Registered before CORS so rejected requests still get CORS headers
+@app.middleware("http")
+async def rate_limit(request: Request, call_next):
+    """Per-client rate limiting for the booking endpoints"""
+    path = request.url.path
+    if path.startswith(API_PREFIX) and path[len(API_PREFIX):] in RATE_LIMITED_PATHS:
+        # Read the ASGI scope directly rather than building request.client
+        client = request.scope.get("client")
+        client_ip = client[0] if client else "default"
+        if is_rate_limited(client_ip):
+            return Response(content=_RATE_LIMITED_BODY, status_code=429, media_type="application/json")
+    return await call_next(request)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -21,7 +40,15 @@ app.add_middleware(
 )
 
 # Include routes
-app.include_router(router, prefix="/api/v1")
+app.include_router(router, prefix=API_PREFIX)
+
+@app.on_event("startup")
+async def startup():
+    await init_agent()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_agent()
 
 @app.get("/")
 async def root():
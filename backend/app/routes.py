@@ -1,22 +1,22 @@
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from fastapi.responses import JSONResponse
 from fastapi.security import APIKeyHeader
 from app.schemas import BookingRequest, BookingResponse, CalendarStatsResponse, AvailabilityRequest
 from app.booking_agent import AdvancedBookingAgent, Intent
 from app.logging_config import logger
-from datetime import datetime, timedelta
+from datetime import timedelta, time as time_of_day
 import asyncio
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from pydantic import BaseModel
-import pytz
 import time
 import re
-from functools import wraps
+from collections import OrderedDict
+from functools import lru_cache
 
 router = APIRouter(tags=["booking"])
 
-_agent_instance = None
-_agent_error = None
+# Set once if building the agent fails, so later requests fail fast instead of retrying
+_agent_error: Optional[str] = None
 
 # Optional API key header for basic authentication will add this feature later !! 
 API_KEY_NAME = "X-API-Key"
@@ -24,57 +24,182 @@ api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
 _REQUESTS_PER_MINUTE = 60
 _RATE_LIMIT_SECONDS = 60 / _REQUESTS_PER_MINUTE
-_last_request_times: Dict[str, float] = {}
+_MAX_TRACKED_CLIENTS = 10000
+# Intervals only, so a clock that can't jump with NTP/DST adjustments
+_now = time.monotonic
+# client -> last request time, least recently seen first; capped so distinct IPs can't grow it forever
+_last_request_times: "OrderedDict[str, float]" = OrderedDict()
 
-def rate_limit():
-    """Rate limiting decorator"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            
-            request = None
-            for arg in args:
-                if isinstance(arg, Request):
-                    request = arg
-                    break
-            
-            client_ip = "default"
-            if request:
-                client_ip = request.client.host if request.client else "default"
-            
-            current_time = time.time()
-            last_request = _last_request_times.get(client_ip, 0)
-            
-            if current_time - last_request < _RATE_LIMIT_SECONDS:
-                raise HTTPException(
-                    status_code=429,
-                    detail="Too many requests. Please try again later."
-                )
-            
-            _last_request_times[client_ip] = current_time
-            return await func(*args, **kwargs)
-        return wrapper
-    return decorator
+# Healthy probe results are reused for a while so liveness polling doesn't hit the LLM every time
+_HEALTH_PROBE = "hello"
+_HEALTH_TTL = 30.0
+# probe message -> (monotonic timestamp, response payload)
+_health_cache: Dict[str, Tuple[float, Dict]] = {}
 
-def get_agent():
+# Replies to fixed read-only prompts, reused briefly under bursts of identical requests.
+# Keys include _calendar_version, which endpoints that may change the calendar bump.
+_RUN_CACHE_TTL = 10.0
+_calendar_version = 0
+# (message, calendar version) -> (monotonic timestamp, reply)
+_run_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}
+
+# Compiled once at import; used to pull details back out of the agent's replies.
+# Booking replies are scanned once for either a success phrase (group 1) or a meeting time (group 2).
+_BOOKING_REPLY_RE = re.compile(
+    r"(?i)(successfully booked|booking confirmed|meeting scheduled|appointment created|event added)"
+    r"|(\w+,\s+\w+\s+\d+\s+at\s+\d+:\d+\s*[AP]M|\w+\s+at\s+\d+:\d+\s*[AP]M|\d+:\d+\s*[AP]M\s+on\s+\w+)"
+)
+# Either the agent's "1. **Title** / 📅 when / ⏱️ N minutes" block or a "1. Title - when (N min)" line
+_MEETINGS_RE = re.compile(
+    r"(?is)(?:(\d+)\.\s*\*\*(.*?)\*\*.*?📅\s*(.*?)(?:\n|⏱️|$).*?⏱️.*?(\d+))"
+    r"|(?:(\d+)\.\s*(.*?)\s*-\s*(.*?)\s*\((\d+)\s*min)"
+)
+
+_MEETING_LIST_PHRASES = ("upcoming meetings",)
+_CANCELLED_PHRASES = (
+    "successfully cancelled", "cancelled", "meeting canceled",
+    "appointment cancelled", "event removed"
+)
+_RESCHEDULED_PHRASES = (
+    "successfully rescheduled", "rescheduled", "meeting moved",
+    "appointment rescheduled", "event updated"
+)
+
+def _contains_any(text: str, phrases: Tuple[str, ...]) -> bool:
+    """Whether any (lowercase) phrase occurs in text, ignoring case
+    
+    A plain loop over `in` beats both a generator under any() and a regex
+    alternation for a handful of short phrases. The agent writes these phrases
+    in lowercase, so the text is only lowercased when the as-is scan misses.
+    """
+    for phrase in phrases:
+        if phrase in text:
+            return True
+    
+    text = text.lower()
+    for phrase in phrases:
+        if phrase in text:
+            return True
+    return False
+
+# Endpoints (relative to the router prefix) that the rate-limit middleware in main.py guards
+RATE_LIMITED_PATHS = frozenset({"/book", "/availability", "/meetings", "/stats", "/preferences"})
+
+def is_rate_limited(client_ip: str) -> bool:
+    """Record a request from the client, or report that it came too soon after the last one"""
+    current_time = _now()
+    last_request = _last_request_times.get(client_ip, float("-inf"))
+    
+    if current_time - last_request < _RATE_LIMIT_SECONDS:
+        return True
+    
+    _last_request_times[client_ip] = current_time
+    _last_request_times.move_to_end(client_ip)
+    if len(_last_request_times) > _MAX_TRACKED_CLIENTS:
+        _last_request_times.popitem(last=False)
+    return False
+
+@lru_cache(maxsize=1)
+def _build_agent() -> AdvancedBookingAgent:
+    """Create the process-wide booking agent; later calls return the cached instance"""
+    logger.info("Initializing booking agent...")
+    agent = AdvancedBookingAgent()
+    # Checked once here so endpoints can call the agent without probing it per request
+    if not callable(getattr(agent, 'run', None)):
+        raise TypeError("Booking agent is missing a callable run method")
+    logger.info("Booking agent initialized successfully")
+    return agent
+
+def get_agent() -> AdvancedBookingAgent:
     """Dependency to get the booking agent instance"""
-    global _agent_instance, _agent_error
+    global _agent_error
     
-    if _agent_instance is None:
-        if _agent_error is not None:
-            logger.error(f"Booking agent initialization failed previously: {_agent_error}")
-            raise HTTPException(status_code=500, detail="Booking agent initialization failed")
-        
+    if _agent_error is not None:
+        logger.error(f"Booking agent initialization failed previously: {_agent_error}")
+        raise HTTPException(status_code=500, detail="Booking agent initialization failed")
+    
+    try:
+        return _build_agent()
+    except Exception as e:
+        _agent_error = str(e)
+        logger.error(f"Failed to initialize booking agent: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to initialize booking agent: {e}")
+
+async def init_agent():
+    """Create and warm up the booking agent at startup so the first request doesn't pay for it"""
+    try:
+        agent = get_agent()
+        # blocking: client construction and credential loading
+        await asyncio.to_thread(agent.warm_up)
+        logger.info("Booking agent warmed up")
+    except Exception as e:
+        # Requests will surface the failure through get_agent
+        logger.error(f"Booking agent warm-up failed: {e}")
+
+async def close_agent():
+    """Release resources held by the booking agent on shutdown"""
+    if _build_agent.cache_info().currsize:
+        await _build_agent().aclose()
+        logger.info("Booking agent connections closed")
+
+# The compiled patterns are bound as default arguments so the hot loops read them as locals.
+# Endpoints can't take them that way: FastAPI would expose the extra parameters as query fields.
+
+def _scan_booking_reply(response: str, booking_re=_BOOKING_REPLY_RE) -> Tuple[bool, Optional[str]]:
+    """Whether a booking reply reports success, and the first meeting time it mentions"""
+    success = False
+    event_time = None
+    for match in booking_re.finditer(response):
+        if match.group(1):
+            success = True
+        elif event_time is None:
+            event_time = match.group(2)
+        if success and event_time is not None:
+            break
+    return success, event_time
+
+def _parse_meetings(response: str, meetings_re=_MEETINGS_RE) -> List[Dict]:
+    """Meeting entries listed in an agent reply"""
+    meetings = []
+    for match in meetings_re.finditer(response):
+        groups = match.groups()
+        meeting_id, summary, start_time, duration = groups[:4] if groups[0] else groups[4:]
         try:
-            logger.info("Initializing booking agent...")
-            _agent_instance = AdvancedBookingAgent()
-            logger.info("Booking agent initialized successfully")
-        except Exception as e:
-            _agent_error = str(e)
-            logger.error(f"Failed to initialize booking agent: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to initialize booking agent: {e}")
+            meetings.append({
+                "id": meeting_id,
+                "summary": summary.strip(),
+                "start_time": start_time.strip(),
+                "duration": int(duration) if duration.isdigit() else 60
+            })
+        except (AttributeError, ValueError) as e:
+            logger.warning(f"Failed to parse meeting entry: {match.group(0)}, error: {e}")
+    return meetings
+
+def _parse_hhmm(value: str) -> time_of_day:
+    """Parse an "HH:MM" string without strptime; raises ValueError when malformed"""
+    hours, _, minutes = value.partition(":")
+    # Same acceptance as strptime("%H:%M"): 1-2 ASCII digits on each side, nothing else
+    for part in (hours, minutes):
+        if not (1 <= len(part) <= 2 and part.isascii() and part.isdigit()):
+            raise ValueError(f"Invalid time: {value!r}")
+    return time_of_day(int(hours), int(minutes))
+
+def _bump_calendar_version():
+    """Invalidate cached replies after a request that may have changed the calendar"""
+    global _calendar_version
+    _calendar_version += 1
+    _run_cache.clear()
+
+async def _cached_run(agent: AdvancedBookingAgent, message: str) -> str:
+    """agent.run for a fixed read-only prompt, served from _run_cache while fresh"""
+    key = (message, _calendar_version)
+    cached = _run_cache.get(key)
+    if cached is not None and _now() - cached[0] < _RUN_CACHE_TTL:
+        return cached[1]
     
-    return _agent_instance
+    response = await agent.run(message)
+    _run_cache[key] = (_now(), response)
+    return response
 
 async def get_api_key(api_key: str = Depends(api_key_header)):
     """Optional API key validation"""
@@ -82,21 +207,17 @@ async def get_api_key(api_key: str = Depends(api_key_header)):
     return api_key
 
 @router.post("/book")
-@rate_limit()
 async def book_meeting(
     request: BookingRequest,
     background_tasks: BackgroundTasks,
-    http_request: Request,
     agent: AdvancedBookingAgent = Depends(get_agent)
 ):
     """Book a meeting with advanced NLP processing"""
     try:
         logger.info(f"Processing booking request: {request.message}")
         
-        if not hasattr(agent, 'run'):
-            raise HTTPException(status_code=500, detail="Booking agent not properly initialized")
-        
-        response = await asyncio.to_thread(agent.run, request.message)
+        response = await agent.run(request.message)
+        _bump_calendar_version()
         logger.info(f"Booking request processed successfully")
         
         event_id = None
@@ -104,23 +225,7 @@ async def book_meeting(
         success = False
         
         if response:
-            response_lower = response.lower()
-            success = any(phrase in response_lower for phrase in [
-                "successfully booked", "booking confirmed", "meeting scheduled",
-                "appointment created", "event added"
-            ])
-            
-            time_patterns = [
-                r"(\w+,\s+\w+\s+\d+\s+at\s+\d+:\d+\s*[AP]M)",
-                r"(\w+\s+at\s+\d+:\d+\s*[AP]M)",
-                r"(\d+:\d+\s*[AP]M\s+on\s+\w+)"
-            ]
-            
-            for pattern in time_patterns:
-                time_match = re.search(pattern, response, re.IGNORECASE)
-                if time_match:
-                    event_time = time_match.group(1)
-                    break
+            success, event_time = _scan_booking_reply(response)
         
         return BookingResponse(
             message=response or "Request processed",
@@ -137,20 +242,15 @@ async def book_meeting(
         raise HTTPException(status_code=500, detail=f"Failed to process booking request: {str(e)}")
 
 @router.post("/availability")
-@rate_limit()
 async def check_availability(
     request: AvailabilityRequest,
-    http_request: Request,
     agent: AdvancedBookingAgent = Depends(get_agent)
 ):
     """Check availability for a time range"""
     try:
         logger.info(f"Processing availability check: {request.message}")
         
-        if not hasattr(agent, 'run'):
-            raise HTTPException(status_code=500, detail="Booking agent not properly initialized")
-        
-        response = await asyncio.to_thread(agent.run, request.message)
+        response = await agent.run(request.message)
         logger.info("Availability check processed successfully")
         
         return BookingResponse(
@@ -163,44 +263,19 @@ async def check_availability(
         raise HTTPException(status_code=500, detail=f"Failed to check availability: {str(e)}")
 
 @router.get("/meetings")
-@rate_limit()
 async def list_meetings(
-    http_request: Request,
     agent: AdvancedBookingAgent = Depends(get_agent)
 ):
     """List upcoming meetings"""
     try:
         logger.info("Processing list meetings request")
         
-        if not hasattr(agent, 'run'):
-            raise HTTPException(status_code=500, detail="Booking agent not properly initialized")
-        
-        response = await asyncio.to_thread(agent.run, "list my meetings")
+        response = await _cached_run(agent, "list my meetings")
         logger.info("Listed upcoming meetings successfully")
         
         meetings = []
-        if response and "upcoming meetings" in response.lower():
-            lines = response.split("\n")
-            for line in lines:
-                patterns = [
-                    r"(\d+)\.\s*\*\*(.*?)\*\*.*?📅\s*(.*?)(?:\n|⏱️|$).*?⏱️.*?(\d+)",
-                    r"(\d+)\.\s*(.*?)\s*-\s*(.*?)\s*\((\d+)\s*min"
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, line, re.DOTALL | re.IGNORECASE)
-                    if match:
-                        try:
-                            meetings.append({
-                                "id": match.group(1),
-                                "summary": match.group(2).strip(),
-                                "start_time": match.group(3).strip(),
-                                "duration": int(match.group(4)) if match.group(4).isdigit() else 60
-                            })
-                            break
-                        except (IndexError, ValueError) as e:
-                            logger.warning(f"Failed to parse meeting line: {line}, error: {e}")
-                            continue
+        if response and _contains_any(response, _MEETING_LIST_PHRASES):
+            meetings = _parse_meetings(response)
         
         return {
             "meetings": meetings,
@@ -213,30 +288,22 @@ async def list_meetings(
         raise HTTPException(status_code=500, detail=f"Failed to list meetings: {str(e)}")
 
 @router.delete("/meetings")
-@rate_limit()
 async def cancel_meeting(
     request: BookingRequest,
     background_tasks: BackgroundTasks,
-    http_request: Request,
     agent: AdvancedBookingAgent = Depends(get_agent)
 ):  
     """Cancel a meeting"""
     try:
         logger.info(f"Processing cancel meeting request: {request.message}")
         
-        if not hasattr(agent, 'run'):
-            raise HTTPException(status_code=500, detail="Booking agent not properly initialized")
-        
-        response = await asyncio.to_thread(agent.run, request.message)
+        response = await agent.run(request.message)
+        _bump_calendar_version()
         logger.info("Cancel meeting request processed successfully")
         
         success = False
         if response:
-            response_lower = response.lower()
-            success = any(phrase in response_lower for phrase in [
-                "successfully cancelled", "cancelled", "meeting canceled",
-                "appointment cancelled", "event removed"
-            ])
+            success = _contains_any(response, _CANCELLED_PHRASES)
         
         return BookingResponse(
             message=response or "Cancellation processed",
@@ -248,30 +315,22 @@ async def cancel_meeting(
         raise HTTPException(status_code=500, detail=f"Failed to cancel meeting: {str(e)}")
 
 @router.patch("/meetings")
-@rate_limit()
 async def reschedule_meeting(
     request: BookingRequest,
     background_tasks: BackgroundTasks,
-    http_request: Request,
     agent: AdvancedBookingAgent = Depends(get_agent)
 ):
     """Reschedule a meeting"""
     try:
         logger.info(f"Processing reschedule meeting request: {request.message}")
         
-        if not hasattr(agent, 'run'):
-            raise HTTPException(status_code=500, detail="Booking agent not properly initialized")
-        
-        response = await asyncio.to_thread(agent.run, request.message)
+        response = await agent.run(request.message)
+        _bump_calendar_version()
         logger.info("Reschedule meeting request processed successfully")
         
         success = False
         if response:
-            response_lower = response.lower()
-            success = any(phrase in response_lower for phrase in [
-                "successfully rescheduled", "rescheduled", "meeting moved",
-                "appointment rescheduled", "event updated"
-            ])
+            success = _contains_any(response, _RESCHEDULED_PHRASES)
         
         return BookingResponse(
             message=response or "Reschedule processed",
@@ -283,25 +342,14 @@ async def reschedule_meeting(
         raise HTTPException(status_code=500, detail=f"Failed to reschedule meeting: {str(e)}")
 
 @router.get("/stats")
-@rate_limit()
 async def get_calendar_stats(
-    http_request: Request,
     agent: AdvancedBookingAgent = Depends(get_agent)
 ):
     """Get calendar statistics"""
     try:
         logger.info("Processing calendar stats request")
         
-        if not hasattr(agent, 'calendar_service'):
-            logger.warning("Calendar service not available, returning mock stats")
-            return CalendarStatsResponse(
-                total_meetings=0,
-                upcoming_meetings=0,
-                busy_hours_today=0,
-                free_hours_today=8
-            )
-        
-        stats = await asyncio.to_thread(agent.calendar_service.get_calendar_stats)
+        stats = await agent.calendar_service.get_calendar_stats()
         logger.info("Retrieved calendar statistics successfully")
         return CalendarStatsResponse(**stats)
         
@@ -315,19 +363,14 @@ async def get_calendar_stats(
         )
 
 @router.post("/preferences")
-@rate_limit()
 async def set_preferences(
     request: dict,
-    http_request: Request,
     agent: AdvancedBookingAgent = Depends(get_agent)
 ):
     """Set user preferences (timezone, business hours, etc.)"""
     try:
         logger.info("Processing set preferences request")
         
-        if not hasattr(agent, 'set_user_preferences'):
-            raise HTTPException(status_code=500, detail="Preferences feature not available")
-        
         timezone = request.get("timezone")
         business_hours_start = request.get("business_hours_start")
         business_hours_end = request.get("business_hours_end")
@@ -336,14 +379,14 @@ async def set_preferences(
         business_hours = None
         if business_hours_start and business_hours_end:
             try:
-                start_time = datetime.strptime(business_hours_start, "%H:%M").time()
-                end_time = datetime.strptime(business_hours_end, "%H:%M").time()
+                start_time = _parse_hhmm(business_hours_start)
+                end_time = _parse_hhmm(business_hours_end)
                 business_hours = (start_time, end_time)
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid business hours format. Use HH:MM")
         
-        await asyncio.to_thread(
-            agent.set_user_preferences,
+        # Only assigns a few context fields; not worth a thread hop
+        agent.set_user_preferences(
             timezone=timezone,
             business_hours=business_hours,
             default_duration=default_duration
@@ -365,20 +408,19 @@ async def set_preferences(
 async def agent_health_check(agent: AdvancedBookingAgent = Depends(get_agent)):
     """Check if the booking agent is properly initialized and working"""
     try:
-        if hasattr(agent, 'run'):
-            test_response = await asyncio.to_thread(agent.run, "hello")
-            return {
-                "status": "healthy",
-                "agent_initialized": True,
-                "test_response_received": bool(test_response),
-                "agent_type": type(agent).__name__
-            }
-        else:
-            return {
-                "status": "unhealthy",
-                "agent_initialized": False,
-                "error": "Agent missing run method"
-            }
+        cached = _health_cache.get(_HEALTH_PROBE)
+        if cached is not None and _now() - cached[0] < _HEALTH_TTL:
+            return cached[1]
+        
+        test_response = await agent.run(_HEALTH_PROBE)
+        result = {
+            "status": "healthy",
+            "agent_initialized": True,
+            "test_response_received": bool(test_response),
+            "agent_type": type(agent).__name__
+        }
+        _health_cache[_HEALTH_PROBE] = (_now(), result)
+        return result
     except Exception as e:
         logger.error(f"Agent health check failed: {e}")
         return {
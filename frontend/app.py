@@ -1,14 +1,18 @@
 import streamlit as st
+import streamlit.components.v1 as components
+from streamlit.errors import StreamlitAPIException
+import os
+import html
+import math
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import pytz
-import pandas as pd
-import re
+import ciso8601
+import orjson
 import time
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 st.set_page_config(
     page_title="Neural Scheduler Pro",
@@ -17,424 +21,61 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    /* Global Reset & Variables */
-    :root {
-        --primary-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        --secondary-gradient: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        --success-gradient: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        --warning-gradient: linear-gradient(135deg, #fa709a 0%, #fee140 100%);
-        --dark-gradient: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-        --glass-bg: rgba(255, 255, 255, 0.1);
-        --glass-border: rgba(255, 255, 255, 0.2);
-        --text-primary: #2d3748;
-        --text-secondary: #4a5568;
-        --shadow-soft: 0 10px 25px rgba(0, 0, 0, 0.1);
-        --shadow-strong: 0 20px 50px rgba(0, 0, 0, 0.15);
-        --border-radius: 16px;
-        --transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-    }
-    
-    /* Global Styles */
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 25%, #f093fb 50%, #f5576c 75%, #4facfe 100%);
-        background-size: 400% 400%;
-        animation: gradientShift 15s ease infinite;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-    }
-    
-    @keyframes gradientShift {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Main container */
-    .main-container {
-        backdrop-filter: blur(20px);
-        background: var(--glass-bg);
-        border: 1px solid var(--glass-border);
-        border-radius: var(--border-radius);
-        margin: 20px;
-        padding: 30px;
-        box-shadow: var(--shadow-strong);
-        transition: var(--transition);
-    }
-    
-    /* Header section */
-    .header-section {
-        text-align: center;
-        margin-bottom: 40px;
-        padding: 40px 20px;
-        background: linear-gradient(135deg, rgba(255,255,255,0.2) 0%, rgba(255,255,255,0.1) 100%);
-        border-radius: var(--border-radius);
-        backdrop-filter: blur(15px);
-        border: 1px solid rgba(255,255,255,0.3);
-    }
-    
-    .main-title {
-        font-size: 3.5rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #ffffff 0%, #f0f0f0 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 10px;
-        text-shadow: 0 2px 10px rgba(0,0,0,0.3);
-        animation: titleGlow 2s ease-in-out infinite alternate;
-    }
-    
-    @keyframes titleGlow {
-        from { filter: drop-shadow(0 0 20px rgba(255,255,255,0.3)); }
-        to { filter: drop-shadow(0 0 30px rgba(255,255,255,0.6)); }
-    }
-    
-    .subtitle {
-        font-size: 1.2rem;
-        color: rgba(255,255,255,0.8);
-        font-weight: 400;
-        margin-bottom: 20px;
-    }
-    
-    
-    .glass-card {
-        background: rgba(255, 255, 255, 0.15);
-        backdrop-filter: blur(15px);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        border-radius: var(--border-radius);
-        padding: 25px;
-        margin: 20px 0;
-        box-shadow: var(--shadow-soft);
-        transition: var(--transition);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .glass-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-        transition: left 0.7s;
-    }
-    
-    .glass-card:hover::before {
-        left: 100%;
-    }
-    
-    .glass-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 40px rgba(0, 0, 0, 0.2);
-        border-color: rgba(255, 255, 255, 0.4);
-    }
-    
-    /* Chat interface */
-    .chat-container {
-        background: rgba(255, 255, 255, 0.1);
-        backdrop-filter: blur(20px);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        border-radius: var(--border-radius);
-        padding: 25px;
-        max-height: 600px;
-        overflow-y: auto;
-        margin-bottom: 20px;
-        scrollbar-width: thin;
-        scrollbar-color: rgba(255,255,255,0.3) transparent;
-    }
-    
-    .chat-container::-webkit-scrollbar {
-        width: 6px;
-    }
-    
-    .chat-container::-webkit-scrollbar-track {
-        background: transparent;
-    }
-    
-    .chat-container::-webkit-scrollbar-thumb {
-        background: rgba(255,255,255,0.3);
-        border-radius: 3px;
-    }
-    
-    .chat-message {
-        padding: 15px 20px;
-        border-radius: 20px;
-        margin: 10px 0;
-        animation: messageSlideIn 0.5s ease-out;
-        position: relative;
-        backdrop-filter: blur(10px);
-    }
-    
-    @keyframes messageSlideIn {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    .user-message {
-        background: linear-gradient(135deg, rgba(102, 126, 234, 0.8) 0%, rgba(118, 75, 162, 0.8) 100%);
-        color: white;
-        margin-left: 20%;
-        border-bottom-right-radius: 8px;
-        box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3);
-    }
-    
-    .assistant-message {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.9) 0%, rgba(255, 255, 255, 0.7) 100%);
-        color: var(--text-primary);
-        margin-right: 20%;
-        border-bottom-left-radius: 8px;
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
-    }
-    
-    
-    .status-indicator {
-        display: inline-flex;
-        align-items: center;
-        padding: 12px 24px;
-        border-radius: 50px;
-        font-weight: 600;
-        margin: 10px 0;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255,255,255,0.3);
-        transition: var(--transition);
-    }
-    
-    .status-healthy {
-        background: linear-gradient(135deg, rgba(79, 172, 254, 0.8) 0%, rgba(0, 242, 254, 0.8) 100%);
-        color: white;
-        animation: pulse 2s infinite;
-    }
-    
-    .status-error {
-        background: linear-gradient(135deg, rgba(250, 112, 154, 0.8) 0%, rgba(254, 225, 64, 0.8) 100%);
-        color: white;
-        animation: shake 0.5s ease-in-out;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { transform: scale(1); }
-        50% { transform: scale(1.05); }
-    }
-    
-    @keyframes shake {
-        0%, 100% { transform: translateX(0); }
-        25% { transform: translateX(-5px); }
-        75% { transform: translateX(5px); }
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background: var(--primary-gradient);
-        color: white;
-        border: none;
-        border-radius: 50px;
-        padding: 12px 30px;
-        font-weight: 600;
-        font-size: 16px;
-        transition: var(--transition);
-        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-        transition: left 0.6s;
-    }
-    
-    .stButton > button:hover::before {
-        left: 100%;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 12px 30px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background: rgba(255, 255, 255, 0.1);
-        border-radius: 50px;
-        padding: 8px;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        border-radius: 50px;
-        color: rgba(255, 255, 255, 0.7);
-        font-weight: 600;
-        transition: var(--transition);
-        background: transparent;
-        border: none;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: var(--primary-gradient);
-        color: white;
-        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-    }
-    
-    
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div > div,
-    .stNumberInput > div > div > input {
-        background: rgba(255, 255, 255, 0.9);
-        border: 1px solid rgba(255, 255, 255, 0.3);
-        border-radius: 12px;
-        color: var(--text-primary);
-        font-weight: 500;
-        transition: var(--transition);
-        backdrop-filter: blur(10px);
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus,
-    .stSelectbox > div > div > div:focus,
-    .stNumberInput > div > div > input:focus {
-        border-color: rgba(102, 126, 234, 0.6);
-        box-shadow: 0 0 20px rgba(102, 126, 234, 0.2);
-        transform: scale(1.02);
-    }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background: rgba(45, 55, 72, 0.95);
-        backdrop-filter: blur(20px);
-        border-right: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    
-    /* Metrics */
-    .metric-card {
-        background: rgba(255, 255, 255, 0.15);
-        backdrop-filter: blur(15px);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        border-radius: var(--border-radius);
-        padding: 20px;
-        text-align: center;
-        transition: var(--transition);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .metric-card:hover {
-        transform: scale(1.05);
-        box-shadow: 0 15px 35px rgba(0, 0, 0, 0.2);
-    }
-    
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 800;
-        background: var(--primary-gradient);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 5px;
-    }
-    
-    .metric-label {
-        color: rgba(255, 255, 255, 0.8);
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        font-size: 0.9rem;
-    }
-    
-    /* Data tables */
-    .stDataFrame {
-        background: rgba(255, 255, 255, 0.9);
-        border-radius: var(--border-radius);
-        backdrop-filter: blur(15px);
-        border: 1px solid rgba(255, 255, 255, 0.3);
-        overflow: hidden;
-    }
-    
-    /* Loading spinner */
-    .stSpinner {
-        text-align: center;
-    }
-    
-    /* Custom animations */
-    @keyframes float {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-10px); }
-    }
-    
-    .floating {
-        animation: float 3s ease-in-out infinite;
-    }
-    
-    /* Responsive design */
-    @media (max-width: 768px) {
-        .main-title {
-            font-size: 2.5rem;
-        }
-        
-        .user-message,
-        .assistant-message {
-            margin-left: 10%;
-            margin-right: 10%;
-        }
-        
-        .glass-card {
-            margin: 10px 0;
-            padding: 20px;
-        }
-    }
-    
-    /* Notification toast */
-    .notification-toast {
-        position: fixed;
-        top: 20px;
-        right: 20px;
-        z-index: 1000;
-        background: rgba(255, 255, 255, 0.95);
-        backdrop-filter: blur(15px);
-        border: 1px solid rgba(255, 255, 255, 0.3);
-        border-radius: var(--border-radius);
-        padding: 20px;
-        box-shadow: var(--shadow-strong);
-        animation: slideInRight 0.5s ease-out;
-    }
-    
-    @keyframes slideInRight {
-        from {
-            transform: translateX(100%);
-            opacity: 0;
-        }
-        to {
-            transform: translateX(0);
-            opacity: 1;
-        }
-    }
-    </style>
-""", unsafe_allow_html=True)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+@st.cache_data(show_spinner=False)
+def load_css():
+    with open(os.path.join(STATIC_DIR, "app.css"), encoding="utf-8") as f:
+        return f.read()
+
+# With static serving on, the browser fetches and caches the stylesheet once instead of
+# receiving and re-parsing the whole stylesheet on every rerun
+if st.get_option("server.enableStaticServing"):
+    st.markdown('<link rel="stylesheet" href="app/static/app.css">', unsafe_allow_html=True)
+else:
+    st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Backend URL
-BACKEND_URL = "http://localhost:8000"
+BACKEND_URL = os.environ.get("BACKEND_URL", "http://localhost:8000")
+BREAKER_COOLDOWN_SECONDS = 15
+# st.cache_data is shared by every session, so caches keyed on schedule contents or the
+# clock are bounded to keep memory flat on a long-running server
+CACHE_MAX_ENTRIES = 32
+
+class BackendSession(requests.Session):
+    """Session with a circuit breaker: after a connection failure or timeout, calls fail
+    fast for a cooldown instead of each waiting on an offline backend"""
+
+    def __init__(self):
+        super().__init__()
+        self.open_until = 0.0
+
+    def request(self, method, url, **kwargs):
+        if time.monotonic() < self.open_until:
+            raise requests.exceptions.ConnectionError("Circuit open - backend recently unreachable")
+        try:
+            return super().request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.open_until = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+            raise
+
+def create_http_session():
+    """Pooled keep-alive session so backend calls reuse connections across reruns"""
+    session = BackendSession()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=1, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+# One session per browser session; Streamlit re-executes this script on every rerun
+if "http" not in st.session_state:
+    st.session_state.http = create_http_session()
+http = st.session_state.http
 
 if "messages" not in st.session_state:
     st.session_state.messages = []
@@ -457,9 +98,11 @@ if "analytics" not in st.session_state:
         "meeting_efficiency": 85
     }
 
+# Cached briefly so reruns (every click and keystroke) don't each wait on the probe
+@st.cache_data(ttl=10, show_spinner=False)
 def check_backend_health():
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=5)
+        response = http.get(f"{BACKEND_URL}/health", timeout=(1.0, 2.0))
         if response.status_code == 200:
             data = response.json()
             return data.get("status") == "healthy", data.get("message", "All systems operational")
@@ -471,23 +114,378 @@ def check_backend_health():
     except Exception as e:
         return False, f"Unexpected error: {str(e)}"
 
+# The counters depend only on the start times and the clock, so a refresh that returns the
+# same schedule within the same minute reuses the previous result
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def compute_analytics(start_times, now):
+    """Meeting counters from a single pass over the start times"""
+    today = now.date()
+    meetings_today = upcoming_meetings = 0
+    for start_time in start_times:
+        if not start_time:
+            continue
+        try:
+            start = ciso8601.parse_datetime(start_time)
+        except (TypeError, ValueError):
+            continue
+        if start.tzinfo is not None:
+            # now is naive local time; compare offset-bearing times in the same frame
+            start = start.astimezone().replace(tzinfo=None)
+        if start.date() == today:
+            meetings_today += 1
+        if start > now:
+            upcoming_meetings += 1
+    return {
+        "total_meetings": len(start_times),
+        "meetings_today": meetings_today,
+        "upcoming_meetings": upcoming_meetings
+    }
+
 def fetch_meetings():
     try:
-        response = requests.get(f"{BACKEND_URL}/api/v1/meetings", timeout=10)
+        response = http.get(f"{BACKEND_URL}/api/v1/meetings", timeout=10)
         if response.status_code == 200:
             meetings = response.json()
+            if isinstance(meetings, dict):
+                meetings = meetings.get("meetings", [])
             st.session_state.meetings = meetings
-            # Update analytics
-            today = datetime.now().date()
-            st.session_state.analytics["total_meetings"] = len(meetings)
-            st.session_state.analytics["meetings_today"] = len([m for m in meetings if datetime.fromisoformat(m.get("start_time", "")).date() == today])
-            st.session_state.analytics["upcoming_meetings"] = len([m for m in meetings if datetime.fromisoformat(m.get("start_time", "")) > datetime.now()])
+            start_times = tuple(m.get("start_time") for m in meetings)
+            st.session_state.analytics.update(
+                compute_analytics(start_times, datetime.now().replace(second=0, microsecond=0))
+            )
             return True
         return False
     except Exception as e:
         st.error(f"Error fetching meetings: {str(e)}")
         return False
 
+def chat_message(role, content):
+    """New chat history entry; the content is escaped once here rather than on every render"""
+    return {
+        "role": role,
+        "content": content,
+        "content_html": html.escape(content).replace("\n", "<br>"),
+        "timestamp": datetime.now().strftime("%H:%M")
+    }
+
+def message_html(message):
+    """HTML for one chat bubble, built once and kept on the message as _html"""
+    cached = message.get("_html")
+    if cached is None:
+        role_class = "user-message" if message["role"] == "user" else "assistant-message"
+        timestamp = message.get("timestamp", datetime.now().strftime("%H:%M"))
+        cached = (
+            f'<div class="chat-message {role_class}">'
+            f'<div style="font-size: 0.8em; opacity: 0.7; margin-bottom: 5px;">{html.escape(timestamp)}</div>'
+            f'<div>{message["content_html"]}</div>'
+            '</div>'
+        )
+        message["_html"] = cached
+    return cached
+
+def render_chat_html(messages):
+    """Whole chat history as one HTML block. New messages are appended to the cached body;
+    it is rebuilt from scratch only when the history no longer extends it (e.g. after a clear)"""
+    count = len(messages)
+    signature = (count, id(messages[-1]) if messages else None)
+    cached = st.session_state.get("_chat_html")
+    if cached is None or cached[0] != signature:
+        (cached_count, cached_last), body = (cached[0], cached[2]) if cached else ((0, None), "")
+        if not (0 < cached_count < count and id(messages[cached_count - 1]) == cached_last):
+            cached_count, body = 0, ""
+        body += "".join(message_html(message) for message in messages[cached_count:])
+        cached = (signature, f'<div class="chat-container">{body}</div>', body)
+        st.session_state._chat_html = cached
+    return cached[1]
+
+def send_chat_message(prompt):
+    """Send one chat turn to the backend and return the assistant's reply"""
+    try:
+        response = http.post(
+            f"{BACKEND_URL}/api/v1/book",
+            json={"message": prompt},
+            timeout=30
+        )
+        if response.status_code == 200:
+            result = response.json()
+            return result.get("message", "I couldn't process that request.")
+        return f"❌ Service error (Status: {response.status_code})"
+    except requests.exceptions.ConnectionError:
+        return "🔌 Backend service is offline. Please check if the server is running."
+    except requests.exceptions.Timeout:
+        return "⏰ Request timed out. Please try again."
+    except Exception as e:
+        return f"❌ Unexpected error: {str(e)}"
+
+def rerun_chat():
+    """Rerun just the chat fragment, or the whole app when this is a full-app run"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+@st.cache_resource
+def get_chat_executor():
+    """Worker threads for backend chat calls, shared by all sessions"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def submit_prompt(prompt):
+    """Show the user's message right away and fetch the reply in the background"""
+    st.session_state.messages.append(chat_message("user", prompt))
+    st.session_state.pending_reply = get_chat_executor().submit(send_chat_message, prompt)
+    rerun_chat()
+
+# Quick suggestion buttons as (label, prompt sent without the emoji)
+SUGGESTIONS = [
+    (label, label.split(" ", 1)[1])
+    for label in (
+        "📅 Book meeting tomorrow 3pm",
+        "🔍 Show my schedule today",
+        "❌ Cancel next meeting",
+        "📋 List all meetings"
+    )
+]
+
+# Runs as a fragment so a chat turn reruns only the chat, not the sidebar and other sections
+@st.fragment
+def chat_panel():
+    st.markdown(render_chat_html(st.session_state.messages), unsafe_allow_html=True)
+    
+    pending_reply = st.session_state.get("pending_reply")
+    if pending_reply is not None:
+        if pending_reply.done():
+            st.session_state.pending_reply = None
+            st.session_state.messages.append(chat_message("assistant", pending_reply.result()))
+            rerun_chat()
+        st.markdown('<div class="chat-message assistant-message">🧠 AI thinking...</div>', unsafe_allow_html=True)
+
+    st.markdown("#### 💡 Quick Suggestions")
+    suggestion_cols = st.columns(len(SUGGESTIONS))
+    for i, (label, prompt) in enumerate(SUGGESTIONS):
+        with suggestion_cols[i]:
+            if st.button(label, key=f"suggestion_{i}", use_container_width=True, disabled=pending_reply is not None):
+                submit_prompt(prompt)
+
+    if prompt := st.chat_input("💬 Ask me anything about your schedule...", disabled=pending_reply is not None):
+        submit_prompt(prompt)
+    
+    if pending_reply is not None:
+        # Poll at 10 Hz only while a reply is outstanding
+        time.sleep(0.1)
+        rerun_chat()
+
+def meetings_signature(meetings):
+    """Hashable cache key covering every field of every meeting (ids are only list ordinals)"""
+    return tuple(
+        tuple((k, repr(v)) for k, v in sorted(m.items()) if not k.startswith("_"))
+        for m in meetings
+    )
+
+# Keyed by meetings_signature; the leading underscore keeps Streamlit from hashing the list
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def meetings_to_csv(signature, _meetings):
+    """CSV export of the meetings, without the client-side memo fields"""
+    import pandas as pd
+    
+    rows = [{k: v for k, v in m.items() if not k.startswith("_")} for m in _meetings]
+    return pd.DataFrame(rows).to_csv(index=False)
+
+def cancel_meeting(meeting):
+    """Ask the backend to cancel a meeting; returns True on success"""
+    try:
+        prompt = f"Cancel my {meeting.get('summary', 'meeting')}"
+        response = http.delete(
+            f"{BACKEND_URL}/api/v1/meetings",
+            json={"message": prompt},
+            timeout=30
+        )
+        if response.status_code == 200:
+            return True
+        st.error(f"❌ Cancellation failed: Status {response.status_code}")
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+    return False
+
+# Keyed by meetings_signature; the list itself is not hashed
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def meetings_details_html(signature, _meetings):
+    """All meetings as native <details> blocks, so opening one is browser-local and costs no rerun"""
+    blocks = []
+    for m in _meetings:
+        summary = html.escape(str(m.get("summary", "Untitled Meeting")))
+        start_time = html.escape(str(m.get("start_time", "No time")))
+        blocks.append(
+            f'<details class="meeting-details"><summary>📅 {summary} - {start_time}</summary>'
+            '<div class="glass-card">'
+            f'<div><strong>📝 Title:</strong> {summary}</div>'
+            f'<div><strong>🕐 Time:</strong> {start_time}</div>'
+            f'<div><strong>⏱️ Duration:</strong> {html.escape(str(m.get("duration", "N/A")))} minutes</div>'
+            f'<div><strong>📍 Location:</strong> {html.escape(str(m.get("location", "Virtual")))}</div>'
+            f'<div><strong>👥 Attendees:</strong> {html.escape(str(m.get("attendees", 1)))}</div>'
+            f'<div><strong>⚡ Priority:</strong> {html.escape(str(m.get("priority", "Medium")))}</div>'
+            '</div></details>'
+        )
+    return "".join(blocks)
+
+# Edit/Cancel for every meeting goes through one table. As a fragment, picking actions
+# reruns only the table.
+@st.fragment
+def meeting_table(meetings):
+    import pandas as pd
+    
+    df = pd.DataFrame({
+        "summary": [m.get("summary", "Untitled Meeting") for m in meetings],
+        "start_time": [m.get("start_time", "No time") for m in meetings],
+        "action": [""] * len(meetings)
+    })
+    
+    # A fresh key after applying actions drops the previous selections
+    table_version = st.session_state.get("meeting_table_version", 0)
+    edited = st.data_editor(
+        df,
+        key=f"meeting_table_{table_version}",
+        hide_index=True,
+        use_container_width=True,
+        disabled=["summary", "start_time"],
+        column_config={
+            "summary": "📝 Title",
+            "start_time": "🕐 Time",
+            "action": st.column_config.SelectboxColumn("Action", options=["", "edit", "cancel"])
+        }
+    )
+    
+    if st.button("✅ Apply Actions", key="apply_meeting_actions"):
+        actions = edited["action"].tolist()
+        if "edit" in actions:
+            st.info("Edit functionality coming soon!")
+        
+        cancelled = 0
+        with st.spinner("Cancelling meetings..."):
+            for meeting, action in zip(meetings, actions):
+                if action == "cancel" and cancel_meeting(meeting):
+                    cancelled += 1
+        
+        st.session_state.meeting_table_version = table_version + 1
+        if cancelled:
+            st.success(f"✅ Cancelled {cancelled} meeting(s)")
+            fetch_meetings()
+            st.rerun()
+
+def glass_card():
+    """Container styled as a glass card. Raw '<div>' open/close markdown can't wrap Streamlit
+    elements, so a hidden marker inside the container lets app.css style the block itself."""
+    container = st.container()
+    container.markdown('<span class="glass-card-marker"></span>', unsafe_allow_html=True)
+    return container
+
+def empty_state_html(icon, title, text):
+    """Placeholder for a section with no data; the styling lives in app.css"""
+    return f'<div class="glass-card empty-state"><div class="empty-state-icon">{icon}</div><h3>{title}</h3><p>{text}</p></div>'
+
+# Base layout for the analytics figures. A fixed uirevision lets Plotly.react update the plot
+# in place, keeping zoom/pan.
+BASE_DARK_LAYOUT = dict(
+    template="plotly_dark",
+    height=400,
+    uirevision="analytics",
+    transition_duration=0
+)
+
+# Partial plotly.js bundle with the scatter/scattergl traces, far smaller than the full build
+# st.plotly_chart ships; the version matches the plotly package in requirements.txt
+PLOTLY_JS_URL = "https://cdn.plot.ly/plotly-gl2d-2.35.2.min.js"
+
+def plotly_html(figure):
+    """Standalone chart page for components.html from a plain {"data", "layout"} figure dict"""
+    payload = orjson.dumps(figure, option=orjson.OPT_SERIALIZE_NUMPY).decode().replace("</", "<\\/")
+    return (
+        '<body style="margin: 0;"><div id="chart"></div>'
+        f'<script src="{PLOTLY_JS_URL}"></script>'
+        f'<script>const fig = {payload}; Plotly.react("chart", fig.data, fig.layout, {{responsive: true}});</script>'
+        '</body>'
+    )
+
+# Validating a layout and expanding its template is most of the cost of building a go.Figure,
+# so the trend layout is validated once per process and reused as plain JSON.
+# Plotly is imported here rather than at the top so cold starts don't pay for it.
+@st.cache_resource(show_spinner=False)
+def trend_layout():
+    import plotly.graph_objects as go
+    
+    return go.Layout(
+        BASE_DARK_LAYOUT,
+        title="Meeting Activity (Last 7 Days)",
+        xaxis_title="Date",
+        yaxis_title="Number of Meetings",
+        showlegend=False
+    ).to_plotly_json()
+
+# Analytics charts are rebuilt only when the meeting list (or, for the trend, the day) changes
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def build_trend_chart(signature, today):
+    import numpy as np
+    import plotly.graph_objects as go
+    
+    # Arrays rather than lists so plotly skips its per-element conversion
+    end = np.datetime64(today, 'D')
+    dates = np.arange(end - np.timedelta64(7, 'D'), end, dtype='datetime64[D]')
+    meeting_counts = np.asarray([2, 1, 3, 2, 4, 1, 2], dtype=np.int32)  # Sample data
+    
+    # WebGL trace, so longer windows stay cheap to draw
+    trace = go.Scattergl(
+        x=dates,
+        y=meeting_counts,
+        mode='lines+markers',
+        name='Daily Meetings',
+        line=dict(color='rgba(102, 126, 234, 0.8)', width=3),
+        marker=dict(size=8, color='rgba(102, 126, 234, 1)')
+    )
+    return plotly_html({"data": [trace.to_plotly_json()], "layout": trend_layout()})
+
+def donut_svg(labels, counts, colors):
+    """Donut chart as inline SVG with a legend; a handful of arcs doesn't need a plotly trace"""
+    total = sum(counts)
+    outer, inner = 45, 18
+    angle = -math.pi / 2
+    paths = []
+    legend = []
+    for label, count, color in zip(labels, counts, colors):
+        label = html.escape(label)
+        share = count / total if total else 0
+        # A full circle can't be drawn as one arc, so stop just short of it
+        sweep = min(share, 0.9999) * 2 * math.pi
+        end = angle + sweep
+        large_arc = 1 if sweep > math.pi else 0
+        x0, y0 = 50 + outer * math.cos(angle), 50 + outer * math.sin(angle)
+        x1, y1 = 50 + outer * math.cos(end), 50 + outer * math.sin(end)
+        x2, y2 = 50 + inner * math.cos(end), 50 + inner * math.sin(end)
+        x3, y3 = 50 + inner * math.cos(angle), 50 + inner * math.sin(angle)
+        if count:
+            paths.append(
+                f'<path d="M{x0:.2f},{y0:.2f} A{outer},{outer} 0 {large_arc} 1 {x1:.2f},{y1:.2f} '
+                f'L{x2:.2f},{y2:.2f} A{inner},{inner} 0 {large_arc} 0 {x3:.2f},{y3:.2f} Z" fill="{color}">'
+                f'<title>{label}: {count} ({share:.0%})</title></path>'
+            )
+        legend.append(
+            f'<span><i style="background: {color};"></i>{label} · {count} ({share:.0%})</span>'
+        )
+        angle = end
+    return (
+        '<div class="donut-chart">'
+        f'<svg viewBox="0 0 100 100" role="img">{"".join(paths)}</svg>'
+        f'<div class="donut-legend">{"".join(legend)}</div>'
+        '</div>'
+    )
+
+# Tuple literals are compiled as constants, so reruns don't rebuild them
+MEETING_TYPES = ('Team Sync', 'Client Call', 'Interview', 'Workshop', 'Review')
+MEETING_TYPE_COLORS = ('#667eea', '#764ba2', '#f093fb', '#f5576c', '#4facfe')
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def build_types_donut(signature):
+    counts = (5, 3, 2, 4, 2)  # Sample data
+    return donut_svg(MEETING_TYPES, counts, MEETING_TYPE_COLORS)
+
 st.markdown("""
     <div class="header-section">
         <div class="main-title floating">🧠 Neural Scheduler Pro</div>
@@ -541,7 +539,7 @@ with st.sidebar:
 
     if st.button("💾 Save Preferences", use_container_width=True):
         try:
-            response = requests.post(
+            response = http.post(
                 f"{BACKEND_URL}/api/v1/preferences",
                 json={
                     "timezone": timezone,
@@ -575,6 +573,11 @@ with st.sidebar:
         st.markdown('<div class="status-indicator status-healthy">✅ System Online</div>', unsafe_allow_html=True)
     else:
         st.markdown(f'<div class="status-indicator status-error">❌ {health_message}</div>', unsafe_allow_html=True)
+    
+    if st.button("🔁 Recheck", use_container_width=True):
+        http.open_until = 0.0
+        check_backend_health.clear()
+        st.rerun()
 
     st.markdown("---")
     
@@ -588,403 +591,180 @@ with st.sidebar:
         st.session_state.messages = []
         st.rerun()
 
-tab1, tab2, tab3, tab4 = st.tabs(["💬 AI Assistant", "📅 Smart Calendar", "📋 Meeting Hub", "📊 Analytics"])
+# One clock reading per script run, so every section agrees on "now" and "today". Fragments
+# rerun without re-executing this line, so code inside them reads the clock itself.
+NOW = datetime.now()
+TODAY = NOW.date()
 
-with tab1:
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.markdown("### 🤖 Conversational AI Assistant")
-    st.markdown("Interact with your intelligent scheduling assistant using natural language.")
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-    for message in st.session_state.messages:
-        role_class = "user-message" if message["role"] == "user" else "assistant-message"
-        timestamp = message.get("timestamp", datetime.now().strftime("%H:%M"))
-        st.markdown(f'''
-            <div class="chat-message {role_class}">
-                <div style="font-size: 0.8em; opacity: 0.7; margin-bottom: 5px;">{timestamp}</div>
-                <div>{message["content"]}</div>
-            </div>
-        ''', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+# A radio instead of st.tabs: tabs run every body on each rerun, here only the selected section runs
+SECTIONS = ["💬 AI Assistant", "📅 Smart Calendar", "📋 Meeting Hub", "📊 Analytics"]
+section = st.radio("Section", SECTIONS, horizontal=True, key="active_tab", label_visibility="collapsed")
 
-    st.markdown("#### 💡 Quick Suggestions")
-    suggestion_cols = st.columns(4)
-    suggestions = [
-        "📅 Book meeting tomorrow 3pm",
-        "🔍 Show my schedule today",
-        "❌ Cancel next meeting",
-        "📋 List all meetings"
-    ]
+if section == SECTIONS[0]:
+    with glass_card():
+        st.markdown("### 🤖 Conversational AI Assistant")
+        st.markdown("Interact with your intelligent scheduling assistant using natural language.")
     
-    for i, suggestion in enumerate(suggestions):
-        with suggestion_cols[i]:
-            if st.button(suggestion, key=f"suggestion_{i}", use_container_width=True):
-                prompt = suggestion.split(" ", 1)[1]  
-                st.session_state.messages.append({
-                    "role": "user", 
-                    "content": prompt,
-                    "timestamp": datetime.now().strftime("%H:%M")
-                })
-                # Process the suggestion
-                with st.spinner("🧠 AI thinking..."):
+    chat_panel()
+
+elif section == SECTIONS[1]:
+    with glass_card():
+        st.markdown("### 📅 Intelligent Calendar Management")
+        
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            selected_date = st.date_input(
+                "📆 Select Date",
+                value=datetime.now(pytz.timezone(st.session_state.preferences["timezone"])).date(),
+                min_value=TODAY,
+                max_value=TODAY + timedelta(days=90)
+            )
+        
+        with col2:
+            if st.button("🔍 Check Availability", use_container_width=True):
+                with st.spinner("🔄 Analyzing schedule..."):
                     try:
-                        response = requests.post(
-                            f"{BACKEND_URL}/api/v1/book",
-                            json={"message": prompt},
-                            timeout=30
+                        response = http.post(
+                            f"{BACKEND_URL}/api/v1/availability",
+                            json={"message": f"What's available on {selected_date.strftime('%Y-%m-%d')}?"},
+                            timeout=10
                         )
                         if response.status_code == 200:
                             result = response.json()
-                            assistant_response = result.get("message", "I couldn't process that request.")
+                            st.success(f"📊 {result.get('message', 'Schedule analyzed')}")
                         else:
-                            assistant_response = f"Service temporarily unavailable (Error: {response.status_code})"
+                            st.error(f"❌ Analysis failed: Status {response.status_code}")
                     except Exception as e:
-                        assistant_response = f"❌ Connection error: {str(e)}"
-                
-                st.session_state.messages.append({
-                    "role": "assistant", 
-                    "content": assistant_response,
-                    "timestamp": datetime.now().strftime("%H:%M")
-                })
-                st.rerun()
-
-    if prompt := st.chat_input("💬 Ask me anything about your schedule..."):
-        st.session_state.messages.append({
-            "role": "user", 
-            "content": prompt,
-            "timestamp": datetime.now().strftime("%H:%M")
-        })
-        
-        with st.spinner("🧠 AI Processing..."):
-            try:
-                response = requests.post(
-                    f"{BACKEND_URL}/api/v1/book",
-                    json={"message": prompt},
-                    timeout=30
-                )
-                if response.status_code == 200:
-                    result = response.json()
-                    assistant_response = result.get("message", "I couldn't process that request.")
-                else:
-                    assistant_response = f"❌ Service error (Status: {response.status_code})"
-            except requests.exceptions.ConnectionError:
-                assistant_response = "🔌 Backend service is offline. Please check if the server is running."
-            except requests.exceptions.Timeout:
-                assistant_response = "⏰ Request timed out. Please try again."
-            except Exception as e:
-                assistant_response = f"❌ Unexpected error: {str(e)}"
-
-        st.session_state.messages.append({
-            "role": "assistant", 
-            "content": assistant_response,
-            "timestamp": datetime.now().strftime("%H:%M")
-        })
-        st.rerun()
-
-with tab2:
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.markdown("### 📅 Intelligent Calendar Management")
-    
-    col1, col2 = st.columns([2, 1])
+                        st.error(f"❌ Error: {str(e)}")
     
-    with col1:
-        selected_date = st.date_input(
-            "📆 Select Date",
-            value=datetime.now(pytz.timezone(st.session_state.preferences["timezone"])).date(),
-            min_value=datetime.now().date(),
-            max_value=datetime.now().date() + timedelta(days=90)
-        )
-    
-    with col2:
-        if st.button("🔍 Check Availability", use_container_width=True):
-            with st.spinner("🔄 Analyzing schedule..."):
+    with glass_card():
+        st.markdown("### ⚡ Quick Book Meeting")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            meeting_title = st.text_input("📝 Meeting Title", value="Team Sync", placeholder="Enter meeting name...")
+            meeting_type = st.selectbox("🏷️ Meeting Type", ["Team Sync", "Client Call", "Interview", "Workshop", "Review", "Other"])
+        
+        with col2:
+            meeting_time = st.time_input("🕐 Start Time", value=NOW.replace(minute=0, second=0, microsecond=0).time())
+            priority = st.selectbox("⚡ Priority", ["Low", "Medium", "High", "Critical"])
+        
+        with col3:
+            duration = st.selectbox("⏱️ Duration", [15, 30, 45, 60, 90, 120], index=3)
+            attendees = st.number_input("👥 Attendees", min_value=1, max_value=50, value=2)
+        
+        if st.button("📅 Book Meeting", use_container_width=True):
+            with st.spinner("🚀 Creating meeting..."):
                 try:
-                    response = requests.post(
-                        f"{BACKEND_URL}/api/v1/availability",
-                        json={"message": f"What's available on {selected_date.strftime('%Y-%m-%d')}?"},
-                        timeout=10
+                    meeting_datetime = datetime.combine(selected_date, meeting_time)
+                    meeting_datetime = pytz.timezone(st.session_state.preferences["timezone"]).localize(meeting_datetime)
+        
+                    prompt = f"Book a {priority.lower()} priority {meeting_type} titled '{meeting_title}' on {selected_date.strftime('%Y-%m-%d')} at {meeting_time.strftime('%I:%M %p')} for {duration} minutes with {attendees} attendees"
+        
+                    response = http.post(
+                        f"{BACKEND_URL}/api/v1/book",
+                        json={"message": prompt},
+                        timeout=30
                     )
                     if response.status_code == 200:
                         result = response.json()
-                        st.success(f"📊 {result.get('message', 'Schedule analyzed')}")
+                        st.success(f"✅ {result.get('message', 'Meeting booked successfully!')}")
+                        if st.session_state.preferences["notifications"]:
+                            # CSS toast that slides in and fades out on its own, instead of the canvas balloons
+                            st.markdown('<div class="notification-toast">🎉 Meeting booked!</div>', unsafe_allow_html=True)
                     else:
-                        st.error(f"❌ Analysis failed: Status {response.status_code}")
+                        st.error(f"❌ Booking failed: Status {response.status_code}")
                 except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.markdown("### ⚡ Quick Book Meeting")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        meeting_title = st.text_input("📝 Meeting Title", value="Team Sync", placeholder="Enter meeting name...")
-        meeting_type = st.selectbox("🏷️ Meeting Type", ["Team Sync", "Client Call", "Interview", "Workshop", "Review", "Other"])
-    
-    with col2:
-        meeting_time = st.time_input("🕐 Start Time", value=datetime.now().replace(minute=0, second=0, microsecond=0).time())
-        priority = st.selectbox("⚡ Priority", ["Low", "Medium", "High", "Critical"])
-    
-    with col3:
-        duration = st.selectbox("⏱️ Duration", [15, 30, 45, 60, 90, 120], index=3)
-        attendees = st.number_input("👥 Attendees", min_value=1, max_value=50, value=2)
-    
-    if st.button("📅 Book Meeting", use_container_width=True):
-        with st.spinner("🚀 Creating meeting..."):
-            try:
-                meeting_datetime = datetime.combine(selected_date, meeting_time)
-                meeting_datetime = pytz.timezone(st.session_state.preferences["timezone"]).localize(meeting_datetime)
-                
-                prompt = f"Book a {priority.lower()} priority {meeting_type} titled '{meeting_title}' on {selected_date.strftime('%Y-%m-%d')} at {meeting_time.strftime('%I:%M %p')} for {duration} minutes with {attendees} attendees"
-                
-                response = requests.post(
-                    f"{BACKEND_URL}/api/v1/book",
-                    json={"message": prompt},
-                    timeout=30
-                )
-                if response.status_code == 200:
-                    result = response.json()
-                    st.success(f"✅ {result.get('message', 'Meeting booked successfully!')}")
-                    if st.session_state.preferences["notifications"]:
-                        st.balloons()
-                else:
-                    st.error(f"❌ Booking failed: Status {response.status_code}")
-            except Exception as e:
-                st.error(f"❌ Error booking meeting: {str(e)}")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+                    st.error(f"❌ Error booking meeting: {str(e)}")
 
-with tab3:
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.markdown("### 📋 Meeting Management Hub")
-    
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.markdown("**Upcoming Meetings Overview**")
-    with col2:
-        if st.button("🔄 Refresh", use_container_width=True):
-            with st.spinner("🔄 Syncing meetings..."):
-                if fetch_meetings():
-                    st.success("✅ Meetings updated")
-                else:
-                    st.error("❌ Update failed")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    if st.session_state.meetings:
-        for i, meeting in enumerate(st.session_state.meetings):
-            with st.expander(f"📅 {meeting.get('summary', 'Untitled Meeting')} - {meeting.get('start_time', 'No time')}"):
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.markdown(f"**📝 Title:** {meeting.get('summary', 'N/A')}")
-                    st.markdown(f"**🕐 Time:** {meeting.get('start_time', 'N/A')}")
-                    st.markdown(f"**⏱️ Duration:** {meeting.get('duration', 'N/A')} minutes")
-                
-                with col2:
-                    st.markdown(f"**📍 Location:** {meeting.get('location', 'Virtual')}")
-                    st.markdown(f"**👥 Attendees:** {meeting.get('attendees', 1)}")
-                    st.markdown(f"**⚡ Priority:** {meeting.get('priority', 'Medium')}")
-                
-                with col3:
-                    if st.button(f"✏️ Edit", key=f"edit_{i}"):
-                        st.info("Edit functionality coming soon!")
-                    if st.button(f"❌ Cancel", key=f"cancel_{i}"):
-                        with st.spinner("Cancelling meeting..."):
-                            try:
-                                prompt = f"Cancel my {meeting.get('summary', 'meeting')}"
-                                response = requests.delete(
-                                    f"{BACKEND_URL}/api/v1/meetings",
-                                    json={"message": prompt},
-                                    timeout=30
-                                )
-                                if response.status_code == 200:
-                                    st.success("✅ Meeting cancelled")
-                                    fetch_meetings()
-                                    st.rerun()
-                                else:
-                                    st.error(f"❌ Cancellation failed: Status {response.status_code}")
-                            except Exception as e:
-                                st.error(f"❌ Error: {str(e)}")
+elif section == SECTIONS[2]:
+    with glass_card():
+        st.markdown("### 📋 Meeting Management Hub")
         
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.markdown("### ⚡ Bulk Actions")
-        
-        col1, col2, col3 = st.columns(3)
+        col1, col2 = st.columns([3, 1])
         with col1:
-            if st.button("📧 Send Reminders", use_container_width=True):
-                st.info("📧 Reminders sent to all attendees!")
-        
+            st.markdown("**Upcoming Meetings Overview**")
         with col2:
-            if st.button("📊 Export Schedule", use_container_width=True):
-                df = pd.DataFrame(st.session_state.meetings)
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    label="💾 Download CSV",
-                    data=csv,
-                    file_name=f"meetings_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
-        
-        with col3:
-            if st.button("🔄 Sync Calendar", use_container_width=True):
-                st.info("🔄 Calendar sync initiated!")
+            if st.button("🔄 Refresh", use_container_width=True):
+                with st.spinner("🔄 Syncing meetings..."):
+                    if fetch_meetings():
+                        st.success("✅ Meetings updated")
+                    else:
+                        st.error("❌ Update failed")
+    
+    if st.session_state.meetings:
+        meetings = st.session_state.meetings
+        st.markdown(meetings_details_html(meetings_signature(meetings), meetings), unsafe_allow_html=True)
+        meeting_table(meetings)
         
-        st.markdown('</div>', unsafe_allow_html=True)
+        with glass_card():
+            st.markdown("### ⚡ Bulk Actions")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if st.button("📧 Send Reminders", use_container_width=True):
+                    st.info("📧 Reminders sent to all attendees!")
+            
+            with col2:
+                if st.button("📊 Export Schedule", use_container_width=True):
+                    meetings = st.session_state.meetings
+                    csv = meetings_to_csv(meetings_signature(meetings), meetings)
+                    st.download_button(
+                        label="💾 Download CSV",
+                        data=csv,
+                        file_name=f"meetings_{NOW.strftime('%Y%m%d')}.csv",
+                        mime="text/csv"
+                    )
+            
+            with col3:
+                if st.button("🔄 Sync Calendar", use_container_width=True):
+                    st.info("🔄 Calendar sync initiated!")
     
     else:
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.markdown("""
-            <div style="text-align: center; padding: 40px;">
-                <div style="font-size: 4rem; margin-bottom: 20px;">📅</div>
-                <h3 style="color: rgba(255,255,255,0.8);">No meetings scheduled</h3>
-                <p style="color: rgba(255,255,255,0.6);">Start by booking your first meeting using the AI assistant!</p>
-            </div>
-        """, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(empty_state_html("📅", "No meetings scheduled", "Start by booking your first meeting using the AI assistant!"), unsafe_allow_html=True)
 
-with tab4:
-    st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-    st.markdown("### 📊 Advanced Analytics Dashboard")
-    
-    # Metrics row
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{st.session_state.analytics['total_meetings']}</div>
-                <div class="metric-label">Total Meetings</div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{st.session_state.analytics['meetings_today']}</div>
-                <div class="metric-label">Today's Meetings</div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{st.session_state.analytics['upcoming_meetings']}</div>
-                <div class="metric-label">Upcoming</div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{st.session_state.analytics['meeting_efficiency']}%</div>
-                <div class="metric-label">Efficiency</div>
-            </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    if st.session_state.meetings:
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.markdown("### 📈 Meeting Trends")
+elif section == SECTIONS[3]:
+    with glass_card():
+        st.markdown("### 📊 Advanced Analytics Dashboard")
         
-        dates = [datetime.now().date() - timedelta(days=x) for x in range(7, 0, -1)]
-        meeting_counts = [2, 1, 3, 2, 4, 1, 2]  # Sample data
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=dates,
-            y=meeting_counts,
-            mode='lines+markers',
-            name='Daily Meetings',
-            line=dict(color='rgba(102, 126, 234, 0.8)', width=3),
-            marker=dict(size=8, color='rgba(102, 126, 234, 1)')
-        ))
-        
-        fig.update_layout(
-            title="Meeting Activity (Last 7 Days)",
-            xaxis_title="Date",
-            yaxis_title="Number of Meetings",
-            template="plotly_dark",
-            height=400,
-            showlegend=False
+        # Metrics row as one markdown payload laid out by CSS grid, instead of four columns
+        analytics = st.session_state.analytics
+        metrics = (
+            (analytics['total_meetings'], "Total Meetings"),
+            (analytics['meetings_today'], "Today's Meetings"),
+            (analytics['upcoming_meetings'], "Upcoming"),
+            (f"{analytics['meeting_efficiency']}%", "Efficiency")
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.markdown("### 🏷️ Meeting Types Distribution")
-        
-        # Sample data
-        meeting_types = ['Team Sync', 'Client Call', 'Interview', 'Workshop', 'Review']
-        counts = [5, 3, 2, 4, 2]
-        
-        fig = go.Figure(data=[go.Pie(
-            labels=meeting_types,
-            values=counts,
-            hole=0.4,
-            marker_colors=['#667eea', '#764ba2', '#f093fb', '#f5576c', '#4facfe']
-        )])
-        
-        fig.update_layout(
-            title="Meeting Types Distribution",
-            template="plotly_dark",
-            height=400
+        cards = "".join(
+            f'<div class="metric-card"><div class="metric-value">{value}</div><div class="metric-label">{label}</div></div>'
+            for value, label in metrics
         )
+        st.markdown(f'<div class="metrics-row">{cards}</div>', unsafe_allow_html=True)
+    
+    if st.session_state.meetings:
+        meetings = st.session_state.meetings
+        signature = (len(meetings), meetings[-1].get("id") or meetings[-1].get("start_time"))
         
-        st.plotly_chart(fig, use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with glass_card():
+            st.markdown("### 📈 Meeting Trends")
+            components.html(build_trend_chart(signature, TODAY), height=BASE_DARK_LAYOUT["height"])
+        
+        with glass_card():
+            st.markdown("### 🏷️ Meeting Types Distribution")
+            st.markdown(build_types_donut(signature), unsafe_allow_html=True)
     
     else:
-        st.markdown('<div class="glass-card">', unsafe_allow_html=True)
-        st.markdown("""
-            <div style="text-align: center; padding: 40px;">
-                <div style="font-size: 4rem; margin-bottom: 20px;">📊</div>
-                <h3 style="color: rgba(255,255,255,0.8);">No analytics data available</h3>
-                <p style="color: rgba(255,255,255,0.6);">Schedule some meetings to see your analytics!</p>
-            </div>
-        """, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown(empty_state_html("📊", "No analytics data available", "Schedule some meetings to see your analytics!"), unsafe_allow_html=True)
 
+# Footer styles live in app.css so each rerun only sends the markup
 st.markdown("""
-    <div style="margin-top: 50px; padding: 30px; text-align: center; background: rgba(255,255,255,0.1); backdrop-filter: blur(15px); border-radius: 16px; border: 1px solid rgba(255,255,255,0.2);">
-        <div style="font-size: 1.2rem; font-weight: 600; color: white; margin-bottom: 10px;">
-            🧠 Neural Scheduler Pro
-        </div>
-        <div style="color: rgba(255,255,255,0.7); margin-bottom: 15px;">
-            Powered by Advanced AI • Natural Language Processing • Smart Automation
-        </div>
-        <div style="display: flex; justify-content: center; gap: 20px; flex-wrap: wrap;">
-            <span style="color: rgba(255,255,255,0.6);">🚀 Version 2.0</span>
-            <span style="color: rgba(255,255,255,0.6);">•</span>
-            <span style="color: rgba(255,255,255,0.6);">⚡ Ultra-Fast Performance</span>
-            <span style="color: rgba(255,255,255,0.6);">•</span>
-            <span style="color: rgba(255,255,255,0.6);">🔒 Enterprise Security</span>
+    <div class="app-footer">
+        <div class="app-footer-title">🧠 Neural Scheduler Pro</div>
+        <div class="app-footer-tagline">Powered by Advanced AI • Natural Language Processing • Smart Automation</div>
+        <div class="app-footer-badges">
+            <span>🚀 Version 2.0</span><span>•</span><span>⚡ Ultra-Fast Performance</span><span>•</span><span>🔒 Enterprise Security</span>
         </div>
     </div>
 """, unsafe_allow_html=True)
-
-st.markdown("""
-    <script>
-    // Add smooth scrolling
-    document.documentElement.style.scrollBehavior = 'smooth';
-    
-    // Add some interactive elements
-    document.addEventListener('DOMContentLoaded', function() {
-        // Add click animation to cards
-        const cards = document.querySelectorAll('.glass-card');
-        cards.forEach(card => {
-            card.addEventListener('click', function() {
-                this.style.transform = 'scale(0.98)';
-                setTimeout(() => {
-                    this.style.transform = 'scale(1)';
-                }, 100);
-            });
-        });
-    });
-    </script>
-""", unsafe_allow_html=True)
\ No newline at end of file